@@ -1,31 +1,163 @@
 """The LEDFX integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import aiohttp
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import CONF_HOST, CONF_PORT, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    ATTR_PLAYLIST,
+    ATTR_POLLS,
+    CONF_AUDIO_SENSORS,
+    CONF_AUDIO_WINDOW,
+    CONF_ENABLE_METRICS,
+    CONF_ENTITY_KINDS,
+    CONF_HOST,
+    CONF_PORT,
+    CONF_TRANSITION_RATE,
+    CONF_VIRTUALS,
+    DEFAULT_AUDIO_SENSORS,
+    DEFAULT_AUDIO_WINDOW,
+    DEFAULT_ENABLE_METRICS,
+    DEFAULT_ENTITY_KINDS,
+    DEFAULT_PROFILE_DURATION,
+    DEFAULT_TRANSITION_RATE,
+    DOMAIN,
+    MAX_PROFILE_DURATION,
+    SERVICE_ALL_OFF,
+    SERVICE_NEXT_PLAYLIST,
+    SERVICE_PROFILE,
+    SERVICE_START_PLAYLIST,
+    SERVICE_STOP_PLAYLIST,
+)
+from .audio import LEDFXAudioMonitor
+from .bootstrap import async_fetch_snapshot
+from .coordinator import LEDFXCoordinator
+from .effect_memory import LEDFXEffectMemory
+from .hub import LEDFXHub
 from .ledfx_client import LEDFXClient
+from .metrics import LEDFXMetrics
+from .playlists import LEDFXPlaylists
+from .presets import LEDFXPresetCatalog
+from .profiler import async_run_profile
+from .provisioning import LEDFXProvisioner
+from .stream import LEDFXEventStream
+from .transition import LEDFXTransitionScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SWITCH, Platform.SELECT]
+PLATFORMS: list[Platform] = [
+    Platform.SWITCH,
+    Platform.LIGHT,
+    Platform.SELECT,
+    Platform.SENSOR,
+    Platform.CAMERA,
+]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-def should_include_virtual(virtual_id: str, virtual_data: dict) -> bool:
-    """Determine if a virtual should be included based on its ID."""
-    # Filter out background, foreground, and mask virtuals
-    virtual_name = virtual_data.get("config", {}).get("name", virtual_id).lower()
-    excluded_suffixes = ["-background", "-foreground", "-mask"]
-    
-    return not any(virtual_name.endswith(suffix) for suffix in excluded_suffixes)
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=MAX_PROFILE_DURATION)
+        ),
+        vol.Optional(ATTR_POLLS): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+PLAYLIST_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+START_PLAYLIST_SCHEMA = PLAYLIST_SCHEMA.extend({vol.Required(ATTR_PLAYLIST): cv.string})
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the LEDFX hub and services."""
+    hass.data.setdefault(DOMAIN, {})
+    hub = hass.data[DOMAIN]["hub"] = LEDFXHub(hass)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, hub.async_close)
+
+    async def async_handle_profile(call: ServiceCall) -> None:
+        """Profile the integration for a duration or a number of polls."""
+        task = hass.data[DOMAIN].get("profile_task")
+        if task and not task.done():
+            raise HomeAssistantError("A LEDFX profile is already running")
+
+        duration = call.data.get(ATTR_DURATION)
+        polls = call.data.get(ATTR_POLLS)
+        if duration is None and polls is None:
+            duration = DEFAULT_PROFILE_DURATION
+
+        # Run in the background so the service call returns right away
+        hass.data[DOMAIN]["profile_task"] = hass.async_create_task(
+            async_run_profile(hass, hub.coordinators, duration, polls)
+        )
+
+    async def async_handle_all_off(call: ServiceCall) -> None:
+        """Turn off all virtuals on all LEDFX servers."""
+        await hub.async_all_off()
+
+    def get_playlists(call: ServiceCall) -> LEDFXPlaylists:
+        """Return the playlists of the server a service call is for."""
+        servers = {
+            entry_id: playlists
+            for entry_id in hub.servers
+            if (playlists := hass.data[DOMAIN].get(f"{entry_id}_playlists")) is not None
+        }
+        entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+        if entry_id is None:
+            # The server can be left out when only one supports playlists
+            if len(servers) != 1:
+                raise HomeAssistantError(
+                    f"Set {ATTR_CONFIG_ENTRY_ID} to pick one of {len(servers)} LEDFX "
+                    "servers with playlists"
+                )
+            return next(iter(servers.values()))
+        if entry_id not in servers:
+            raise HomeAssistantError(f"No loaded LEDFX server with playlists for {entry_id}")
+        return servers[entry_id]
+
+    async def async_handle_start_playlist(call: ServiceCall) -> None:
+        """Start a playlist on a LEDFX server."""
+        playlist = call.data[ATTR_PLAYLIST]
+        if not await get_playlists(call).async_start(playlist):
+            raise HomeAssistantError(f"Could not start LEDFX playlist {playlist}")
+
+    async def async_handle_stop_playlist(call: ServiceCall) -> None:
+        """Stop the playlist running on a LEDFX server."""
+        if not await get_playlists(call).async_stop():
+            raise HomeAssistantError("Could not stop the LEDFX playlist")
+
+    async def async_handle_next_playlist(call: ServiceCall) -> None:
+        """Skip to the next item of the playlist running on a LEDFX server."""
+        if not await get_playlists(call).async_next():
+            raise HomeAssistantError("Could not advance the LEDFX playlist")
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, async_handle_profile, schema=PROFILE_SCHEMA
+    )
+    hass.services.async_register(DOMAIN, SERVICE_ALL_OFF, async_handle_all_off)
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_PLAYLIST, async_handle_start_playlist, schema=START_PLAYLIST_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_PLAYLIST, async_handle_stop_playlist, schema=PLAYLIST_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_NEXT_PLAYLIST, async_handle_next_playlist, schema=PLAYLIST_SCHEMA
+    )
+
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -33,53 +165,140 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
 
-    session = async_get_clientsession(hass)
-    client = LEDFXClient(host, port, session)
+    hub: LEDFXHub = hass.data[DOMAIN]["hub"]
+    metrics = LEDFXMetrics(
+        enabled=entry.options.get(CONF_ENABLE_METRICS, DEFAULT_ENABLE_METRICS)
+    )
+    client = LEDFXClient(host, port, hub.session, metrics, hub.stream_session)
 
-    # Test connection
+    # Fetch everything the platforms need at once, this also tests the connection
     try:
-        await client.get_info()
-    except aiohttp.ClientError as err:
+        snapshot = await async_fetch_snapshot(client)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
         _LOGGER.error("Could not connect to LEDFX at %s:%s - %s", host, port, err)
         return False
 
-    async def async_update_data():
-        """Fetch data from LEDFX."""
-        try:
-            all_virtuals = await client.get_virtuals()
-            # Filter out background, foreground, and mask virtuals
-            filtered_virtuals = {
-                vid: vdata 
-                for vid, vdata in all_virtuals.items() 
-                if should_include_virtual(vid, vdata)
-            }
-            return filtered_virtuals
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with LEDFX: {err}") from err
-
-    coordinator = DataUpdateCoordinator(
+    coordinator = LEDFXCoordinator(hass, client, metrics)
+    coordinator.async_set_virtuals(snapshot.virtuals)
+
+    hub.async_register(entry.entry_id, client, coordinator, metrics)
+
+    presets = LEDFXPresetCatalog(hass, client, entry.entry_id)
+
+    transitions = LEDFXTransitionScheduler(
         hass,
-        _LOGGER,
-        name="ledfx",
-        update_method=async_update_data,
-        update_interval=DEFAULT_SCAN_INTERVAL,
+        client,
+        entry.options.get(CONF_TRANSITION_RATE, DEFAULT_TRANSITION_RATE),
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    effect_memory = LEDFXEffectMemory(hass, entry.entry_id, transitions.is_fading)
+    await effect_memory.async_load()
+    entry.async_on_unload(effect_memory.async_track(coordinator))
+
+    # One websocket per server, shared by everything that follows its events
+    stream = LEDFXEventStream(hass, client)
+
+    audio = None
+    if entry.options.get(CONF_AUDIO_SENSORS, DEFAULT_AUDIO_SENSORS):
+        audio = LEDFXAudioMonitor(
+            hass,
+            stream,
+            entry.options.get(CONF_AUDIO_WINDOW, DEFAULT_AUDIO_WINDOW),
+        )
+        audio.async_start()
+
+    playlists = None
+    if snapshot.playlists is not None:
+        playlists = LEDFXPlaylists(hass, client, snapshot.playlists)
+        entry.async_on_unload(playlists.async_track(stream))
+
+    provisioner = LEDFXProvisioner(
+        hass,
+        coordinator,
+        entry.options.get(CONF_ENTITY_KINDS, DEFAULT_ENTITY_KINDS),
+        entry.options.get(CONF_VIRTUALS),
+        lambda: snapshot.async_refresh_devices(client),
+    )
+    # Options may have changed while the entry was not loaded, or in a reload
+    provisioner.async_remove_disabled(entry.entry_id)
+    entry.async_on_unload(provisioner.async_track_virtuals())
 
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = client
     hass.data[DOMAIN][f"{entry.entry_id}_coordinator"] = coordinator
+    hass.data[DOMAIN][f"{entry.entry_id}_metrics"] = metrics
+    hass.data[DOMAIN][f"{entry.entry_id}_snapshot"] = snapshot
+    hass.data[DOMAIN][f"{entry.entry_id}_transitions"] = transitions
+    hass.data[DOMAIN][f"{entry.entry_id}_stream"] = stream
+    hass.data[DOMAIN][f"{entry.entry_id}_audio"] = audio
+    hass.data[DOMAIN][f"{entry.entry_id}_presets"] = presets
+    hass.data[DOMAIN][f"{entry.entry_id}_effect_memory"] = effect_memory
+    hass.data[DOMAIN][f"{entry.entry_id}_playlists"] = playlists
+    hass.data[DOMAIN][f"{entry.entry_id}_provisioner"] = provisioner
+    hass.data[DOMAIN][f"{entry.entry_id}_options"] = dict(entry.options)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    async def async_load_presets() -> None:
+        """Load the preset catalog, preset selects follow once it is in."""
+        try:
+            await presets.async_load(snapshot.info.get("version"), snapshot.effects)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.warning("Could not load LEDFX effect presets: %s", err)
+
+    # A stale catalog takes a request per effect, it must not hold up setup
+    entry.async_create_background_task(
+        hass, async_load_presets(), f"ledfx presets {entry.entry_id}"
+    )
+
+    entry.async_on_unload(entry.add_update_listener(async_options_updated))
+
     return True
 
 
+async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options."""
+    previous = hass.data[DOMAIN][f"{entry.entry_id}_options"]
+    changed = {
+        key
+        for key in previous.keys() | entry.options.keys()
+        if previous.get(key) != entry.options.get(key)
+    }
+
+    # Entity provisioning is applied in place, anything else needs a reload
+    if changed - {CONF_ENTITY_KINDS, CONF_VIRTUALS}:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    hass.data[DOMAIN][f"{entry.entry_id}_options"] = dict(entry.options)
+    await hass.data[DOMAIN][f"{entry.entry_id}_provisioner"].async_update(
+        entry.options.get(CONF_ENTITY_KINDS, DEFAULT_ENTITY_KINDS),
+        entry.options.get(CONF_VIRTUALS),
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
         hass.data[DOMAIN].pop(f"{entry.entry_id}_coordinator")
+        hass.data[DOMAIN].pop(f"{entry.entry_id}_metrics")
+        hass.data[DOMAIN].pop(f"{entry.entry_id}_snapshot")
+        hass.data[DOMAIN].pop(f"{entry.entry_id}_transitions").async_shutdown()
+        hass.data[DOMAIN].pop(f"{entry.entry_id}_presets")
+        # A reload loads the memory again before the delayed save ran
+        await hass.data[DOMAIN].pop(f"{entry.entry_id}_effect_memory").async_save()
+        hass.data[DOMAIN].pop(f"{entry.entry_id}_playlists")
+        hass.data[DOMAIN].pop(f"{entry.entry_id}_provisioner")
+        hass.data[DOMAIN].pop(f"{entry.entry_id}_options")
+        if audio := hass.data[DOMAIN].pop(f"{entry.entry_id}_audio"):
+            audio.async_stop()
+        hass.data[DOMAIN].pop(f"{entry.entry_id}_stream").async_stop()
+        await hass.data[DOMAIN]["hub"].async_unregister(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove cached data of a deleted config entry."""
+    await LEDFXPresetCatalog.async_remove(hass, entry.entry_id)
+    await LEDFXEffectMemory.async_remove(hass, entry.entry_id)
@@ -0,0 +1,125 @@
+"""Audio telemetry from the LEDFX websocket."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import WS_EVENT_AUDIO_LEVEL, WS_EVENT_BEAT
+from .stream import LEDFXEventStream
+
+_LOGGER = logging.getLogger(__name__)
+
+AUDIO_EVENT_TYPES = [WS_EVENT_AUDIO_LEVEL, WS_EVENT_BEAT]
+
+
+class AudioWindow:
+    """Reduce the raw audio stream to per-window statistics."""
+
+    def __init__(self) -> None:
+        """Initialize an empty window."""
+        self.bpm: float | None = None
+        self._level_sum = 0.0
+        self._level_count = 0
+        self._peak = 0.0
+        self._beats = 0
+
+    def add_level(self, level: float) -> None:
+        """Add one audio level sample."""
+        self._level_sum += level
+        self._level_count += 1
+        if level > self._peak:
+            self._peak = level
+
+    def add_beat(self, bpm: float | None = None) -> None:
+        """Add one beat, optionally with the tempo LEDFX detected."""
+        self._beats += 1
+        if bpm:
+            self.bpm = bpm
+
+    def flush(self) -> dict[str, Any]:
+        """Return the statistics of the window and start a new one.
+
+        The tempo is carried over, it only changes when LEDFX reports a new one.
+        """
+        result = {
+            "mean_level": round(self._level_sum / self._level_count, 3) if self._level_count else None,
+            "peak_level": round(self._peak, 3) if self._level_count else None,
+            "bpm": round(self.bpm, 1) if self.bpm else None,
+            "beats": self._beats,
+        }
+        self._level_sum = 0.0
+        self._level_count = 0
+        self._peak = 0.0
+        self._beats = 0
+        return result
+
+
+class LEDFXAudioMonitor:
+    """Follow the LEDFX audio events and publish one summary per window."""
+
+    def __init__(self, hass: HomeAssistant, stream: LEDFXEventStream, window: float) -> None:
+        """Initialize the monitor."""
+        self.hass = hass
+        self.window = window
+        self.data: dict[str, Any] | None = None
+        self._aggregate = AudioWindow()
+        self._stream = stream
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubs: list[Callable[[], None]] = []
+        self._unsub_flush: Callable[[], None] | None = None
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Listen for window summaries."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_start(self) -> None:
+        """Start following the audio events."""
+        self._unsubs = [
+            self._stream.async_subscribe(event_type, self.handle_message)
+            for event_type in AUDIO_EVENT_TYPES
+        ]
+        self._unsub_flush = async_track_time_interval(
+            self.hass, self._async_flush, timedelta(seconds=self.window)
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the audio events."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def handle_message(self, message: dict[str, Any]) -> None:
+        """Feed one websocket event into the current window."""
+        event_type = message.get("event_type")
+        try:
+            if event_type == WS_EVENT_AUDIO_LEVEL:
+                self._aggregate.add_level(float(message["level"]))
+            elif event_type == WS_EVENT_BEAT:
+                bpm = message.get("bpm")
+                self._aggregate.add_beat(float(bpm) if bpm is not None else None)
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.debug("Ignoring malformed LEDFX audio event: %s", message)
+
+    @callback
+    def _async_flush(self, _now: Any = None) -> None:
+        """Close the window and notify listeners."""
+        self.data = self._aggregate.flush()
+        for update_callback in list(self._listeners):
+            update_callback()
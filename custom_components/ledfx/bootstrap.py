@@ -0,0 +1,85 @@
+"""Setup-time snapshot of a LEDFX server."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import aiohttp
+
+from .ledfx_client import LEDFXClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LEDFXSnapshot:
+    """Everything the platforms need to build their entities."""
+
+    def __init__(
+        self,
+        info: dict[str, Any],
+        virtuals: dict[str, Any],
+        devices: dict[str, Any],
+        effects: dict[str, Any],
+        playlists: dict[str, Any] | None,
+    ) -> None:
+        """Initialize the snapshot."""
+        self.info = info
+        self.virtuals = virtuals
+        self.devices = devices
+        self.effects = effects
+        # None when the server does not support playlists
+        self.playlists = playlists
+
+    def device_online(self, virtual_data: dict[str, Any]) -> bool:
+        """Return if the device behind a virtual is online."""
+        device_id = virtual_data.get("is_device")
+        return self.devices.get(device_id, {}).get("online", True) if device_id else True
+
+    async def async_refresh_devices(self, client: LEDFXClient) -> None:
+        """Fetch the device status again, keeping the old one on errors."""
+        try:
+            self.devices = await client.get_devices()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("Failed to get devices: %s", err)
+
+
+async def async_fetch_snapshot(client: LEDFXClient) -> LEDFXSnapshot:
+    """Fetch info, virtuals, devices, effect schema and playlists concurrently.
+
+    Info and virtuals are required and their errors are raised. The rest only
+    enrich the entities, so failing to get them is logged and the snapshot
+    falls back to empty data.
+    """
+    info, virtuals, devices, effects, playlists = await asyncio.gather(
+        client.get_info(),
+        client.get_virtuals(),
+        client.get_devices(),
+        client.get_effects(),
+        client.get_playlists(),
+        return_exceptions=True,
+    )
+
+    for result in (info, virtuals):
+        if isinstance(result, BaseException):
+            raise result
+
+    if isinstance(devices, (aiohttp.ClientError, asyncio.TimeoutError)):
+        _LOGGER.error("Failed to get devices: %s", devices)
+        devices = {}
+    elif isinstance(devices, BaseException):
+        raise devices
+
+    if isinstance(effects, (aiohttp.ClientError, asyncio.TimeoutError)):
+        _LOGGER.error("Error fetching effects: %s", effects)
+        effects = {}
+    elif isinstance(effects, BaseException):
+        raise effects
+
+    if isinstance(playlists, (aiohttp.ClientError, asyncio.TimeoutError)):
+        _LOGGER.error("Error fetching playlists: %s", playlists)
+        playlists = {}
+    elif isinstance(playlists, BaseException):
+        raise playlists
+
+    return LEDFXSnapshot(info, virtuals, devices, effects, playlists)
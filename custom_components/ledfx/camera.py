@@ -0,0 +1,96 @@
+"""Support for LEDFX pixel preview cameras."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from homeassistant.components.camera import Camera
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, ENTITY_KIND_PREVIEW, PREVIEW_FPS, PREVIEW_HEIGHT, PREVIEW_WIDTH
+from .preview import LEDFXPixelPreview, render_preview
+from .provisioning import LEDFXProvisioner
+from .stream import LEDFXEventStream
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up LEDFX preview cameras."""
+    stream: LEDFXEventStream = hass.data[DOMAIN][f"{config_entry.entry_id}_stream"]
+    provisioner: LEDFXProvisioner = hass.data[DOMAIN][f"{config_entry.entry_id}_provisioner"]
+
+    def create_camera(virtual_id: str, virtual_data: dict[str, Any]) -> LEDFXPreviewCamera:
+        preview = LEDFXPixelPreview(hass, stream, virtual_id)
+        return LEDFXPreviewCamera(preview, virtual_id, virtual_data)
+
+    # Entities are only created for enabled virtuals and kinds
+    provisioner.async_add_platform({ENTITY_KIND_PREVIEW: create_camera}, async_add_entities)
+
+
+class LEDFXPreviewCamera(Camera):
+    """Show what a LEDFX virtual is rendering."""
+
+    _attr_has_entity_name = True
+    _attr_frame_interval = 1 / PREVIEW_FPS
+
+    def __init__(
+        self,
+        preview: LEDFXPixelPreview,
+        virtual_id: str,
+        virtual_data: dict[str, Any],
+    ) -> None:
+        """Initialize the camera."""
+        super().__init__()
+        self._preview = preview
+        self._attr_unique_id = f"ledfx_{virtual_id}_preview"
+        self._attr_name = "Preview"
+        self.content_type = "image/png"
+
+        self._image: bytes | None = None
+        self._image_pixels: Any = None
+        self._rendered_at = 0.0
+
+        # Device info for grouping
+        virtual_name = virtual_data.get("config", {}).get("name", virtual_id)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, virtual_id)},
+            "name": virtual_name,
+            "manufacturer": "LEDFX",
+            "model": "Virtual LED",
+        }
+
+    @property
+    def is_streaming(self) -> bool:
+        """Return true while the pixel stream is followed."""
+        return self._preview.subscribed
+
+    async def async_camera_image(
+        self, width: int | None = None, height: int | None = None
+    ) -> bytes | None:
+        """Return the latest frame, rendered at most once per frame interval."""
+        self._preview.async_touch()
+
+        now = time.monotonic()
+        pixels = self._preview.pixels
+        if pixels is None or pixels is self._image_pixels:
+            return self._image
+        if now - self._rendered_at < self.frame_interval:
+            return self._image
+
+        self._image = render_preview(pixels, PREVIEW_WIDTH, PREVIEW_HEIGHT)
+        self._image_pixels = pixels
+        self._rendered_at = now
+        return self._image
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unsubscribe when the entity is removed."""
+        await super().async_will_remove_from_hass()
+        self._preview.async_stop()
@@ -9,10 +9,29 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DEFAULT_PORT, DOMAIN
+from .const import (
+    CONF_AUDIO_SENSORS,
+    CONF_AUDIO_WINDOW,
+    CONF_ENABLE_METRICS,
+    CONF_ENTITY_KINDS,
+    CONF_TRANSITION_RATE,
+    CONF_VIRTUALS,
+    DEFAULT_AUDIO_SENSORS,
+    DEFAULT_AUDIO_WINDOW,
+    DEFAULT_ENABLE_METRICS,
+    DEFAULT_ENTITY_KINDS,
+    DEFAULT_PORT,
+    DEFAULT_TRANSITION_RATE,
+    DOMAIN,
+    ENTITY_KINDS,
+    MAX_AUDIO_WINDOW,
+    MAX_TRANSITION_RATE,
+)
 from .ledfx_client import LEDFXClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,6 +49,14 @@ class LEDFXConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> LEDFXOptionsFlow:
+        """Get the options flow for this handler."""
+        return LEDFXOptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -66,3 +93,73 @@ class LEDFXConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+
+class LEDFXOptionsFlow(config_entries.OptionsFlow):
+    """Handle LEDFX options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        # Virtuals known to the running coordinator, by name
+        coordinator = self.hass.data.get(DOMAIN, {}).get(
+            f"{self._config_entry.entry_id}_coordinator"
+        )
+        virtuals = {
+            virtual_id: virtual_data.get("config", {}).get("name", virtual_id)
+            for virtual_id, virtual_data in (coordinator.data if coordinator else {}).items()
+        }
+
+        options = self._config_entry.options
+
+        if user_input is not None:
+            if not virtuals:
+                # Virtuals are unknown while the entry is not loaded, keep the stored choice
+                if CONF_VIRTUALS in options:
+                    user_input[CONF_VIRTUALS] = options[CONF_VIRTUALS]
+            elif set(user_input.get(CONF_VIRTUALS, [])) >= set(virtuals):
+                # Selecting every virtual also provisions virtuals added later
+                user_input.pop(CONF_VIRTUALS, None)
+            return self.async_create_entry(title="", data=user_input)
+
+        schema = {
+            vol.Optional(
+                CONF_ENABLE_METRICS,
+                default=options.get(CONF_ENABLE_METRICS, DEFAULT_ENABLE_METRICS),
+            ): bool,
+            vol.Optional(
+                CONF_TRANSITION_RATE,
+                default=options.get(CONF_TRANSITION_RATE, DEFAULT_TRANSITION_RATE),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_TRANSITION_RATE)),
+            vol.Optional(
+                CONF_AUDIO_SENSORS,
+                default=options.get(CONF_AUDIO_SENSORS, DEFAULT_AUDIO_SENSORS),
+            ): bool,
+            vol.Optional(
+                CONF_AUDIO_WINDOW,
+                default=options.get(CONF_AUDIO_WINDOW, DEFAULT_AUDIO_WINDOW),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_AUDIO_WINDOW)),
+            vol.Optional(
+                CONF_ENTITY_KINDS,
+                default=options.get(CONF_ENTITY_KINDS, DEFAULT_ENTITY_KINDS),
+            ): cv.multi_select(ENTITY_KINDS),
+        }
+        if virtuals:
+            # Stored virtuals that no longer exist would fail validation
+            schema[
+                vol.Optional(
+                    CONF_VIRTUALS,
+                    default=[
+                        virtual_id
+                        for virtual_id in options.get(CONF_VIRTUALS, virtuals)
+                        if virtual_id in virtuals
+                    ],
+                )
+            ] = cv.multi_select(virtuals)
+
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
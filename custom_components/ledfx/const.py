@@ -7,9 +7,89 @@ DOMAIN = "ledfx"
 CONF_HOST = "host"
 CONF_PORT = "port"
 
+# Options
+CONF_ENABLE_METRICS = "enable_metrics"
+CONF_TRANSITION_RATE = "transition_rate"
+CONF_AUDIO_SENSORS = "audio_sensors"
+CONF_AUDIO_WINDOW = "audio_window"
+CONF_ENTITY_KINDS = "entity_kinds"
+CONF_VIRTUALS = "virtuals"
+
+# Entity kinds that can be provisioned per virtual
+ENTITY_KIND_SWITCH = "switch"
+ENTITY_KIND_LIGHT = "light"
+ENTITY_KIND_EFFECT_REACTIVE = "effect_reactive"
+ENTITY_KIND_EFFECT_STATIC = "effect_static"
+ENTITY_KIND_GRADIENT = "gradient"
+ENTITY_KIND_PRESET = "preset"
+ENTITY_KIND_PREVIEW = "preview"
+
+ENTITY_KINDS = {
+    ENTITY_KIND_SWITCH: "Switch",
+    ENTITY_KIND_LIGHT: "Light",
+    ENTITY_KIND_EFFECT_REACTIVE: "Effect (Audio Reactive)",
+    ENTITY_KIND_EFFECT_STATIC: "Effect (Static)",
+    ENTITY_KIND_GRADIENT: "Gradient",
+    ENTITY_KIND_PRESET: "Preset",
+    ENTITY_KIND_PREVIEW: "Preview camera",
+}
+
 # Defaults
 DEFAULT_PORT = 8888
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
+DEFAULT_ENABLE_METRICS = False
+DEFAULT_TRANSITION_RATE = 10  # steps per second
+MAX_TRANSITION_RATE = 30
+DEFAULT_AUDIO_SENSORS = False
+DEFAULT_AUDIO_WINDOW = 5  # seconds
+MAX_AUDIO_WINDOW = 300
+# Preview cameras write state every few minutes, so they are opt-in
+DEFAULT_ENTITY_KINDS = [kind for kind in ENTITY_KINDS if kind != ENTITY_KIND_PREVIEW]
+
+# Connection pool shared by all LEDFX servers
+POOL_LIMIT = 32
+POOL_LIMIT_PER_HOST = 4
+POOL_KEEPALIVE_TIMEOUT = 60
+REQUEST_TIMEOUT = 10
+
+# Services
+SERVICE_PROFILE = "profile"
+SERVICE_ALL_OFF = "all_off"
+ATTR_DURATION = "duration"
+ATTR_POLLS = "polls"
+SERVICE_START_PLAYLIST = "start_playlist"
+SERVICE_STOP_PLAYLIST = "stop_playlist"
+SERVICE_NEXT_PLAYLIST = "next_playlist"
+ATTR_PLAYLIST = "playlist"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+# Profiling
+DEFAULT_PROFILE_DURATION = 30
+MAX_PROFILE_DURATION = 600
+
+# Pixel preview
+PREVIEW_WIDTH = 128  # pixels after downsampling
+PREVIEW_HEIGHT = 16
+PREVIEW_FPS = 5  # per viewer
+PREVIEW_IDLE_TIMEOUT = 30  # seconds without a viewer before unsubscribing
+
+# Effect presets
+PRESETS_STORAGE_VERSION = 1
+PRESET_CATEGORY_LEDFX = "ledfx_presets"
+PRESET_CATEGORY_USER = "user_presets"
+# Presets load after setup, leave pool connections for polls and commands
+PRESET_FETCH_CONCURRENCY = 2
+
+# Effect config memory
+EFFECT_MEMORY_STORAGE_VERSION = 1
+EFFECT_MEMORY_SIZE = 1000  # (virtual, effect) pairs per LEDFX server
+EFFECT_MEMORY_SAVE_DELAY = 30  # seconds
+
+# Playlists
+PLAYLIST_ACTION_START = "start"
+PLAYLIST_ACTION_STOP = "stop"
+PLAYLIST_ACTION_NEXT = "next"
+PLAYLIST_OFF = "Off"
 
 # API Endpoints
 API_INFO = "/api/info"
@@ -17,6 +97,14 @@ API_VIRTUALS = "/api/virtuals"
 API_SCENES = "/api/scenes"
 API_EFFECTS = "/api/effects"
 
+# Websocket events
+WS_EVENT_AUDIO_LEVEL = "audio_level"
+WS_EVENT_BEAT = "beat"
+WS_EVENT_VISUALISATION = "visualisation_update"
+WS_EVENT_PLAYLIST_STARTED = "playlist_started"
+WS_EVENT_PLAYLIST_STOPPED = "playlist_stopped"
+WS_RECONNECT_INTERVAL = 10
+
 # Effect categories that are audio-reactive
 AUDIO_REACTIVE_CATEGORIES = {
     "Classic",
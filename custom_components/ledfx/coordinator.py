@@ -0,0 +1,90 @@
+"""Data update coordinator for the LEDFX integration."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DEFAULT_SCAN_INTERVAL
+from .ledfx_client import LEDFXClient
+from .metrics import LEDFXMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def should_include_virtual(virtual_id: str, virtual_data: dict) -> bool:
+    """Determine if a virtual should be included based on its ID."""
+    # Filter out background, foreground, and mask virtuals
+    virtual_name = virtual_data.get("config", {}).get("name", virtual_id).lower()
+    excluded_suffixes = ["-background", "-foreground", "-mask"]
+
+    return not any(virtual_name.endswith(suffix) for suffix in excluded_suffixes)
+
+
+def filter_virtuals(all_virtuals: dict[str, Any]) -> dict[str, Any]:
+    """Filter out background, foreground, and mask virtuals."""
+    return {
+        vid: vdata
+        for vid, vdata in all_virtuals.items()
+        if should_include_virtual(vid, vdata)
+    }
+
+
+class LEDFXCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Poll the virtuals of a LEDFX server."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: LEDFXClient,
+        metrics: LEDFXMetrics,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="ledfx",
+            update_interval=DEFAULT_SCAN_INTERVAL,
+        )
+        self.client = client
+        self.metrics = metrics
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from LEDFX."""
+        start = time.perf_counter()
+        try:
+            all_virtuals = await self.client.get_virtuals()
+        except Exception as err:
+            self.metrics.record_poll(time.perf_counter() - start, success=False)
+            raise UpdateFailed(f"Error communicating with LEDFX: {err}") from err
+
+        filtered_virtuals = filter_virtuals(all_virtuals)
+        self.metrics.record_poll(time.perf_counter() - start, success=True)
+        return filtered_virtuals
+
+    @callback
+    def async_set_virtuals(self, all_virtuals: dict[str, Any]) -> None:
+        """Use virtuals fetched elsewhere instead of polling for them."""
+        self.async_set_updated_data(filter_virtuals(all_virtuals))
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify entities and record how long that took."""
+        if not self.metrics.enabled:
+            super().async_update_listeners()
+            return
+        start = time.perf_counter()
+        super().async_update_listeners()
+        elapsed = time.perf_counter() - start
+
+        # Other listeners (effect memory, profiler) are not entities
+        entities = sum(
+            1
+            for update_callback, _ in self._listeners.values()
+            if isinstance(getattr(update_callback, "__self__", None), Entity)
+        )
+        self.metrics.record_notify(entities, elapsed)
@@ -0,0 +1,38 @@
+"""Diagnostics support for LEDFX."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][f"{entry.entry_id}_coordinator"]
+    metrics = hass.data[DOMAIN][f"{entry.entry_id}_metrics"]
+    hub = hass.data[DOMAIN]["hub"]
+    transitions = hass.data[DOMAIN][f"{entry.entry_id}_transitions"]
+
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": str(coordinator.update_interval),
+            "virtuals": len(coordinator.data or {}),
+        },
+        "transitions": {
+            "interval": transitions.interval,
+            "dropped_steps": transitions.dropped_steps,
+        },
+        "metrics": metrics.as_dict(),
+        "hub": hub.aggregate_metrics(),
+    }
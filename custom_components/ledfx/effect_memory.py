@@ -0,0 +1,129 @@
+"""Per-virtual memory of effect configs."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    DOMAIN,
+    EFFECT_MEMORY_SAVE_DELAY,
+    EFFECT_MEMORY_SIZE,
+    EFFECT_MEMORY_STORAGE_VERSION,
+)
+
+
+class LEDFXEffectMemory:
+    """Remember the last config each virtual used for each effect.
+
+    Entries are kept in least recently used order and the oldest ones are
+    evicted beyond ``EFFECT_MEMORY_SIZE``, so memory stays bounded however
+    many virtuals and effects there are. The memory is persisted with a
+    delayed save, so frequent changes are written in one go. Virtuals for
+    which ``is_fading`` is true are not remembered, their config only holds
+    an intermediate brightness and color.
+
+    It also keeps the brightness a virtual had before fading out. LEDFX is
+    left at the last, almost black step, so every way of turning the
+    virtual on puts that brightness back, even after a restart.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        is_fading: Callable[[str], bool],
+    ) -> None:
+        """Initialize the memory."""
+        self._store = Store(
+            hass, EFFECT_MEMORY_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.effect_memory"
+        )
+        self._is_fading = is_fading
+        self._configs: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._brightness: dict[str, float] = {}
+
+    @staticmethod
+    async def async_remove(hass: HomeAssistant, entry_id: str) -> None:
+        """Delete the persisted memory of a config entry."""
+        await Store(
+            hass, EFFECT_MEMORY_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.effect_memory"
+        ).async_remove()
+
+    async def async_load(self) -> None:
+        """Load the persisted memory."""
+        stored = await self._store.async_load()
+        if stored:
+            for virtual_id, effect_type, config in stored.get("configs", []):
+                self._configs[(virtual_id, effect_type)] = config
+            self._brightness = stored.get("brightness", {})
+
+    async def async_save(self) -> None:
+        """Write the memory now instead of after the save delay."""
+        await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the memory in storage format, oldest first."""
+        return {
+            "configs": [
+                [virtual_id, effect_type, config]
+                for (virtual_id, effect_type), config in self._configs.items()
+            ],
+            "brightness": self._brightness,
+        }
+
+    def get(self, virtual_id: str, effect_type: str) -> dict[str, Any] | None:
+        """Return a copy of the remembered config of an effect."""
+        key = (virtual_id, effect_type)
+        config = self._configs.get(key)
+        if config is None:
+            return None
+        self._configs.move_to_end(key)
+        return dict(config)
+
+    @callback
+    def async_remember(self, virtual_id: str, effect_type: str, config: dict[str, Any]) -> None:
+        """Remember the config of an effect, unless the virtual is fading."""
+        if self._is_fading(virtual_id):
+            return
+        key = (virtual_id, effect_type)
+        if self._configs.get(key) == config:
+            return
+        self._configs[key] = dict(config)
+        self._configs.move_to_end(key)
+        while len(self._configs) > EFFECT_MEMORY_SIZE:
+            self._configs.popitem(last=False)
+        self._store.async_delay_save(self._data_to_save, EFFECT_MEMORY_SAVE_DELAY)
+
+    @callback
+    def async_remember_brightness(self, virtual_id: str, brightness: float) -> None:
+        """Remember the brightness to restore after a fade-out."""
+        self._brightness[virtual_id] = brightness
+        self._store.async_delay_save(self._data_to_save, EFFECT_MEMORY_SAVE_DELAY)
+
+    @callback
+    def async_restore_brightness(self, virtual_id: str, config: dict[str, Any]) -> bool:
+        """Put the brightness from before a fade-out into a config, if any."""
+        brightness = self._brightness.pop(virtual_id, None)
+        if brightness is None:
+            return False
+        config["brightness"] = brightness
+        self._store.async_delay_save(self._data_to_save, EFFECT_MEMORY_SAVE_DELAY)
+        return True
+
+    @callback
+    def async_track(self, coordinator: DataUpdateCoordinator) -> Callable[[], None]:
+        """Remember the active effect config of every virtual after each poll."""
+
+        @callback
+        def _async_coordinator_updated() -> None:
+            for virtual_id, virtual_data in (coordinator.data or {}).items():
+                effect = virtual_data.get("effect", {})
+                if effect.get("type") and effect.get("config"):
+                    self.async_remember(virtual_id, effect["type"], effect["config"])
+
+        _async_coordinator_updated()
+        return coordinator.async_add_listener(_async_coordinator_updated)
@@ -0,0 +1,188 @@
+"""Domain-level hub shared by all LEDFX servers."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+from typing import Any
+
+import aiohttp
+
+from homeassistant.const import __version__ as HA_VERSION
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    POOL_KEEPALIVE_TIMEOUT,
+    POOL_LIMIT,
+    POOL_LIMIT_PER_HOST,
+    REQUEST_TIMEOUT,
+)
+from .coordinator import LEDFXCoordinator
+from .ledfx_client import LEDFXClient
+from .metrics import LEDFXMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fraction of the scan interval between consecutive slots. The golden ratio
+# spreads any number of servers evenly without knowing the count up front.
+STAGGER_STEP = 0.6180339887
+
+
+class LEDFXServer:
+    """Objects belonging to one configured LEDFX server."""
+
+    def __init__(
+        self,
+        client: LEDFXClient,
+        coordinator: LEDFXCoordinator,
+        metrics: LEDFXMetrics,
+        slot: int,
+    ) -> None:
+        """Initialize the server record."""
+        self.client = client
+        self.coordinator = coordinator
+        self.metrics = metrics
+        self.slot = slot
+        self.cancel_stagger: Callable[[], None] | None = None
+
+
+class LEDFXHub:
+    """Share a connection pool and poll schedule between LEDFX servers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.servers: dict[str, LEDFXServer] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._stream_session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=POOL_LIMIT,
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+                headers={"User-Agent": f"HomeAssistant/{HA_VERSION} ledfx"},
+            )
+        return self._session
+
+    @property
+    def stream_session(self) -> aiohttp.ClientSession:
+        """Return the session for websockets, creating it on first use.
+
+        A websocket holds its connection for as long as it is open. On the
+        pooled session a few of them would use up the per-host limit and
+        stall every request to that server, so they get their own connector.
+        """
+        if self._stream_session is None or self._stream_session.closed:
+            self._stream_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0),
+                timeout=aiohttp.ClientTimeout(total=None, connect=REQUEST_TIMEOUT),
+                headers={"User-Agent": f"HomeAssistant/{HA_VERSION} ledfx"},
+            )
+        return self._stream_session
+
+    @property
+    def coordinators(self) -> list[LEDFXCoordinator]:
+        """Return the coordinators of all registered servers."""
+        return [server.coordinator for server in self.servers.values()]
+
+    @callback
+    def async_register(
+        self,
+        entry_id: str,
+        client: LEDFXClient,
+        coordinator: LEDFXCoordinator,
+        metrics: LEDFXMetrics,
+    ) -> None:
+        """Register a server and shift its polls into a free slot."""
+        used = {server.slot for server in self.servers.values()}
+        slot = next(index for index in range(len(used) + 1) if index not in used)
+        server = self.servers[entry_id] = LEDFXServer(client, coordinator, metrics, slot)
+
+        # The first server keeps its schedule. Later ones refresh once after
+        # their offset, which moves every following poll by the same amount.
+        offset = (slot * STAGGER_STEP) % 1 * DEFAULT_SCAN_INTERVAL.total_seconds()
+        if offset:
+
+            @callback
+            def _async_staggered_refresh(_now: Any) -> None:
+                server.cancel_stagger = None
+                self.hass.async_create_task(coordinator.async_refresh())
+
+            server.cancel_stagger = async_call_later(
+                self.hass, offset, _async_staggered_refresh
+            )
+        _LOGGER.debug("LEDFX server %s polls in slot %s (+%.1f s)", entry_id, slot, offset)
+
+    async def async_unregister(self, entry_id: str) -> None:
+        """Unregister a server and close the pool after the last one."""
+        server = self.servers.pop(entry_id, None)
+        if server and server.cancel_stagger:
+            server.cancel_stagger()
+        if not self.servers:
+            await self.async_close()
+
+    async def async_close(self, *_: Any) -> None:
+        """Close the pooled and the websocket session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._stream_session is not None:
+            await self._stream_session.close()
+            self._stream_session = None
+
+    async def async_all_off(self) -> None:
+        """Turn off every virtual on every server in parallel."""
+        targets = [
+            (server, virtual_id)
+            for server in self.servers.values()
+            for virtual_id, virtual_data in (server.coordinator.data or {}).items()
+            if virtual_data.get("active")
+        ]
+        results = await asyncio.gather(
+            *(server.client.clear_virtual_effect(virtual_id) for server, virtual_id in targets),
+            return_exceptions=True,
+        )
+        # One unreachable server must not keep the others from refreshing
+        for (server, virtual_id), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                _LOGGER.error(
+                    "Error turning off virtual %s on %s: %s",
+                    virtual_id,
+                    server.client.host,
+                    result or type(result).__name__,
+                )
+        await asyncio.gather(
+            *(coordinator.async_request_refresh() for coordinator in self.coordinators)
+        )
+
+    def aggregate_metrics(self) -> dict[str, Any]:
+        """Return metric totals across all servers."""
+        enabled = [server.metrics for server in self.servers.values() if server.metrics.enabled]
+        requests = sum(metrics.total_requests for metrics in enabled)
+        latency = sum(
+            stats.total_latency
+            for metrics in enabled
+            for stats in metrics.endpoints.values()
+        )
+        return {
+            "servers": len(self.servers),
+            "servers_with_metrics": len(enabled),
+            "requests": requests,
+            "errors": sum(metrics.total_errors for metrics in enabled),
+            "timeouts": sum(metrics.total_timeouts for metrics in enabled),
+            "bytes_received": sum(metrics.total_bytes_received for metrics in enabled),
+            "mean_latency_ms": round(latency / requests * 1000, 2) if requests else None,
+            "polls": sum(metrics.polls for metrics in enabled),
+            "poll_failures": sum(metrics.poll_failures for metrics in enabled),
+            "slots": {entry_id: server.slot for entry_id, server in self.servers.items()},
+        }
@@ -1,29 +1,85 @@
 """LEDFX API Client."""
 import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiohttp
 
+from .metrics import LEDFXMetrics
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class LEDFXClient:
     """Client to interact with LEDFX API."""
 
-    def __init__(self, host: str, port: int, session: aiohttp.ClientSession) -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        session: aiohttp.ClientSession,
+        metrics: LEDFXMetrics | None = None,
+        stream_session: aiohttp.ClientSession | None = None,
+    ) -> None:
         """Initialize the LEDFX client."""
         self.host = host
         self.port = port
         self.session = session
+        # Websockets stay open, so they should not take a pooled connection
+        self.stream_session = stream_session or session
         self.base_url = f"http://{host}:{port}"
+        self.websocket_url = f"ws://{host}:{port}/api/websocket"
+        self.metrics = metrics
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        path: str,
+        payload: dict[str, Any] | None = None,
+        decode: bool = True,
+    ) -> Any:
+        """Send a request and return the decoded JSON body.
+
+        ``endpoint`` is the label metrics are recorded under; it must not
+        contain per-virtual parts so the number of series stays bounded.
+        """
+        url = f"{self.base_url}{path}"
+        metrics = self.metrics
+        if metrics is None or not metrics.enabled:
+            async with self.session.request(method, url, json=payload) as response:
+                response.raise_for_status()
+                return await response.json() if decode else None
+
+        start = time.perf_counter()
+        data = None
+        decode_time = 0.0
+        try:
+            async with self.session.request(method, url, json=payload) as response:
+                response.raise_for_status()
+                body = await response.read()
+                latency = time.perf_counter() - start
+                if decode:
+                    # json() reuses the body read above and keeps aiohttp's checks
+                    decode_start = time.perf_counter()
+                    data = await response.json()
+                    decode_time = time.perf_counter() - decode_start
+        except asyncio.TimeoutError:
+            metrics.record_request(endpoint, time.perf_counter() - start, timeout=True)
+            raise
+        except aiohttp.ClientError:
+            metrics.record_request(endpoint, time.perf_counter() - start, error=True)
+            raise
+
+        metrics.record_request(endpoint, latency, len(body), decode_time)
+        return data
 
     async def get_info(self) -> dict[str, Any]:
         """Get LEDFX server info."""
         try:
-            async with self.session.get(f"{self.base_url}/api/info") as response:
-                response.raise_for_status()
-                return await response.json()
+            return await self._request("GET", "info", "/api/info")
         except aiohttp.ClientError as err:
             _LOGGER.error("Error getting LEDFX info: %s", err)
             raise
@@ -31,10 +87,8 @@ class LEDFXClient:
     async def get_virtuals(self) -> dict[str, Any]:
         """Get all virtuals from LEDFX."""
         try:
-            async with self.session.get(f"{self.base_url}/api/virtuals") as response:
-                response.raise_for_status()
-                data = await response.json()
-                return data.get("virtuals", {})
+            data = await self._request("GET", "virtuals", "/api/virtuals")
+            return data.get("virtuals", {})
         except aiohttp.ClientError as err:
             _LOGGER.error("Error getting virtuals: %s", err)
             raise
@@ -42,10 +96,8 @@ class LEDFXClient:
     async def get_devices(self) -> dict[str, Any]:
         """Get all devices from LEDFX."""
         try:
-            async with self.session.get(f"{self.base_url}/api/devices") as response:
-                response.raise_for_status()
-                data = await response.json()
-                return data.get("devices", {})
+            data = await self._request("GET", "devices", "/api/devices")
+            return data.get("devices", {})
         except aiohttp.ClientError as err:
             _LOGGER.error("Error getting devices: %s", err)
             raise
@@ -61,12 +113,14 @@ class LEDFXClient:
         """Set effect for a virtual."""
         try:
             payload = {"type": effect_type, "config": config}
-            async with self.session.post(
-                f"{self.base_url}/api/virtuals/{virtual_id}/effects",
-                json=payload,
-            ) as response:
-                response.raise_for_status()
-                return True
+            await self._request(
+                "POST",
+                "set_virtual_effect",
+                f"/api/virtuals/{virtual_id}/effects",
+                payload,
+                decode=False,
+            )
+            return True
         except aiohttp.ClientError as err:
             _LOGGER.error("Error setting effect for virtual %s: %s", virtual_id, err)
             return False
@@ -77,12 +131,14 @@ class LEDFXClient:
         """Update effect config for a virtual (when effect is already active)."""
         try:
             payload = {"type": effect_type, "config": config}
-            async with self.session.put(
-                f"{self.base_url}/api/virtuals/{virtual_id}/effects",
-                json=payload,
-            ) as response:
-                response.raise_for_status()
-                return True
+            await self._request(
+                "PUT",
+                "update_virtual_effect",
+                f"/api/virtuals/{virtual_id}/effects",
+                payload,
+                decode=False,
+            )
+            return True
         except aiohttp.ClientError as err:
             _LOGGER.error("Error updating effect for virtual %s: %s", virtual_id, err)
             return False
@@ -90,11 +146,13 @@ class LEDFXClient:
     async def clear_virtual_effect(self, virtual_id: str) -> bool:
         """Clear effect from a virtual (turn off)."""
         try:
-            async with self.session.delete(
-                f"{self.base_url}/api/virtuals/{virtual_id}/effects"
-            ) as response:
-                response.raise_for_status()
-                return True
+            await self._request(
+                "DELETE",
+                "clear_virtual_effect",
+                f"/api/virtuals/{virtual_id}/effects",
+                decode=False,
+            )
+            return True
         except aiohttp.ClientError as err:
             _LOGGER.error("Error clearing effect for virtual %s: %s", virtual_id, err)
             return False
@@ -102,11 +160,89 @@ class LEDFXClient:
     async def get_effects(self) -> dict[str, Any]:
         """Get available effects."""
         try:
-            async with self.session.get(f"{self.base_url}/api/schema") as response:
-                response.raise_for_status()
-                data = await response.json()
-                # Effects are under the "effects" key in the schema
-                return data.get("effects", {})
+            data = await self._request("GET", "schema", "/api/schema")
+            # Effects are under the "effects" key in the schema
+            return data.get("effects", {})
         except aiohttp.ClientError as err:
             _LOGGER.error("Error getting effects: %s", err)
             raise
+
+    def connect_events(self) -> Any:
+        """Open a websocket to the server on the stream session."""
+        return self.stream_session.ws_connect(self.websocket_url, heartbeat=30)
+
+    @staticmethod
+    async def iter_frames(
+        websocket: aiohttp.ClientWebSocketResponse,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the JSON objects received on an open websocket."""
+        async for message in websocket:
+            if message.type == aiohttp.WSMsgType.TEXT:
+                try:
+                    event = message.json()
+                except ValueError:
+                    _LOGGER.debug("Ignoring malformed LEDFX websocket frame: %s", message.data)
+                    continue
+                if isinstance(event, dict):
+                    yield event
+            elif message.type == aiohttp.WSMsgType.ERROR:
+                raise websocket.exception()
+
+    async def get_effect_presets(self, effect_id: str) -> dict[str, Any]:
+        """Get the built-in and user presets of an effect."""
+        try:
+            data = await self._request("GET", "effect_presets", f"/api/effects/{effect_id}/presets")
+            return {
+                "ledfx_presets": data.get("ledfx_presets", {}),
+                "user_presets": data.get("user_presets", {}),
+            }
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Error getting presets for effect %s: %s", effect_id, err)
+            raise
+
+    async def apply_virtual_preset(
+        self, virtual_id: str, category: str, effect_id: str, preset_id: str
+    ) -> bool:
+        """Apply an effect preset to a virtual."""
+        try:
+            payload = {"category": category, "effect_id": effect_id, "preset_id": preset_id}
+            await self._request(
+                "PUT",
+                "apply_virtual_preset",
+                f"/api/virtuals/{virtual_id}/presets",
+                payload,
+                decode=False,
+            )
+            return True
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Error applying preset %s to virtual %s: %s", preset_id, virtual_id, err)
+            return False
+
+    async def get_playlists(self) -> dict[str, Any] | None:
+        """Get all playlists, or None if the server has no playlist support."""
+        try:
+            data = await self._request("GET", "playlists", "/api/playlists")
+            return data.get("playlists", {})
+        except aiohttp.ClientResponseError as err:
+            # LEDFX versions before playlists were added answer 404
+            if err.status == 404:
+                return None
+            _LOGGER.error("Error getting playlists: %s", err)
+            raise
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Error getting playlists: %s", err)
+            raise
+
+    async def control_playlist(self, action: str, playlist_id: str | None = None) -> bool:
+        """Start, stop or advance a playlist on the server."""
+        try:
+            payload = {"action": action}
+            if playlist_id is not None:
+                payload["id"] = playlist_id
+            await self._request(
+                "PUT", "control_playlist", "/api/playlists", payload, decode=False
+            )
+            return True
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Error sending playlist action %s: %s", action, err)
+            return False
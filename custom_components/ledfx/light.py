@@ -7,20 +7,24 @@ from typing import Any
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_RGB_COLOR,
+    ATTR_TRANSITION,
     ColorMode,
     LightEntity,
+    LightEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
-    UpdateFailed,
 )
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .const import DOMAIN, ENTITY_KIND_LIGHT
+from .effect_memory import LEDFXEffectMemory
 from .ledfx_client import LEDFXClient
+from .provisioning import LEDFXProvisioner
+from .transition import LEDFXTransitionScheduler, solid_gradient
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,32 +36,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up LEDFX light entities."""
     client: LEDFXClient = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = hass.data[DOMAIN][f"{config_entry.entry_id}_coordinator"]
+    transitions = hass.data[DOMAIN][f"{config_entry.entry_id}_transitions"]
+    effect_memory: LEDFXEffectMemory = hass.data[DOMAIN][f"{config_entry.entry_id}_effect_memory"]
+    provisioner: LEDFXProvisioner = hass.data[DOMAIN][f"{config_entry.entry_id}_provisioner"]
 
-    async def async_update_data() -> dict[str, Any]:
-        """Fetch data from LEDFX."""
-        try:
-            return await client.get_virtuals()
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with LEDFX: {err}") from err
+    def create_light(virtual_id: str, virtual_data: dict[str, Any]) -> LEDFXLight:
+        return LEDFXLight(coordinator, client, transitions, effect_memory, virtual_id, virtual_data)
 
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="ledfx",
-        update_method=async_update_data,
-        update_interval=DEFAULT_SCAN_INTERVAL,
-    )
-
-    await coordinator.async_config_entry_first_refresh()
-    
-    # Store coordinator for use by other platforms
-    hass.data[DOMAIN][f"{config_entry.entry_id}_coordinator"] = coordinator
-
-    entities = []
-    for virtual_id, virtual_data in coordinator.data.items():
-        entities.append(LEDFXLight(coordinator, client, virtual_id, virtual_data))
-
-    async_add_entities(entities)
+    # Entities are only created for enabled virtuals and kinds
+    provisioner.async_add_platform({ENTITY_KIND_LIGHT: create_light}, async_add_entities)
 
 
 def get_coordinator(hass: HomeAssistant, entry_id: str) -> DataUpdateCoordinator | None:
@@ -71,22 +59,27 @@ class LEDFXLight(CoordinatorEntity, LightEntity):
     _attr_has_entity_name = True
     _attr_color_mode = ColorMode.RGB
     _attr_supported_color_modes = {ColorMode.RGB}
+    _attr_supported_features = LightEntityFeature.TRANSITION
 
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
         client: LEDFXClient,
+        transitions: LEDFXTransitionScheduler,
+        effect_memory: LEDFXEffectMemory,
         virtual_id: str,
         virtual_data: dict[str, Any],
     ) -> None:
         """Initialize the light."""
         super().__init__(coordinator)
         self._client = client
+        self._transitions = transitions
+        self._effect_memory = effect_memory
         self._virtual_id = virtual_id
         self._attr_unique_id = f"ledfx_{virtual_id}"
         virtual_name = virtual_data.get("config", {}).get("name", virtual_id)
-        self._attr_name = virtual_name
-        
+        self._attr_name = None  # Use device name, like the switch
+
         # Device info for grouping with select entity
         self._attr_device_info = {
             "identifiers": {(DOMAIN, virtual_id)},
@@ -158,6 +151,18 @@ class LEDFXLight(CoordinatorEntity, LightEntity):
         if current_effect.get("config"):
             effect_config = current_effect["config"].copy()
 
+        # Undo the dimming of an earlier fade-out, even if it is still running
+        restored = self._effect_memory.async_restore_brightness(self._virtual_id, effect_config)
+
+        if kwargs.get(ATTR_TRANSITION):
+            await self._async_start_transition(
+                effect_type, effect_config, is_active, kwargs
+            )
+            return
+
+        # An instant change overrides any running fade
+        self._transitions.async_cancel(self._virtual_id)
+
         # Update brightness if provided
         if ATTR_BRIGHTNESS in kwargs:
             brightness = kwargs[ATTR_BRIGHTNESS] / 255.0  # Convert to 0.0-1.0
@@ -166,10 +171,8 @@ class LEDFXLight(CoordinatorEntity, LightEntity):
         # Update color if provided
         if ATTR_RGB_COLOR in kwargs:
             rgb = kwargs[ATTR_RGB_COLOR]
-            r, g, b = rgb
             # Set gradient to solid color (same color at 0% and 100%)
-            gradient = f"linear-gradient(90deg, rgb({r}, {g}, {b}) 0%, rgb({r}, {g}, {b}) 100%)"
-            effect_config["gradient"] = gradient
+            effect_config["gradient"] = solid_gradient(rgb)
             # Also set color for effects that use it
             effect_config["color"] = list(rgb)
 
@@ -178,7 +181,7 @@ class LEDFXLight(CoordinatorEntity, LightEntity):
         if not is_active:
             # POST - set new effect
             await self._client.set_virtual_effect(self._virtual_id, effect_type, effect_config)
-        elif ATTR_BRIGHTNESS in kwargs or ATTR_RGB_COLOR in kwargs:
+        elif ATTR_BRIGHTNESS in kwargs or ATTR_RGB_COLOR in kwargs or restored:
             # PUT - update existing effect config (needs type too!)
             await self._client.update_virtual_effect(self._virtual_id, effect_type, effect_config)
 
@@ -186,5 +189,101 @@ class LEDFXLight(CoordinatorEntity, LightEntity):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
+        effect = self.virtual_data.get("effect", {})
+
+        if kwargs.get(ATTR_TRANSITION) and self.is_on and effect.get("type"):
+            current = self._transitions.current_state(self._virtual_id)
+            start_brightness, start_rgb = current or (
+                effect.get("config", {}).get("brightness", 1.0),
+                self.rgb_color,
+            )
+            # Keep the brightness the fade started from, not a dimmed step
+            running_target = self._transitions.target_state(self._virtual_id)
+            if running_target is None or running_target[0] > 0:
+                self._effect_memory.async_remember_brightness(
+                    self._virtual_id, running_target[0] if running_target else start_brightness
+                )
+
+            @callback
+            def _async_faded_out() -> None:
+                self.hass.async_create_task(self._async_clear())
+
+            # Fade towards black, then clear the effect instead of sending
+            # the final step, so LEDFX never stores a config at brightness 0
+            self._transitions.async_start(
+                self._virtual_id,
+                effect["type"],
+                effect.get("config", {}).copy(),
+                start_brightness,
+                0.0,
+                start_rgb,
+                start_rgb,
+                kwargs[ATTR_TRANSITION],
+                _async_faded_out,
+                send_final=False,
+            )
+            return
+
+        self._transitions.async_cancel(self._virtual_id)
+        await self._async_clear()
+
+    async def _async_clear(self) -> None:
+        """Clear the effect and refresh."""
         await self._client.clear_virtual_effect(self._virtual_id)
         await self.coordinator.async_request_refresh()
+
+    async def _async_start_transition(
+        self,
+        effect_type: str,
+        effect_config: dict[str, Any],
+        is_active: bool,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Fade brightness and color to the requested values."""
+        current = self._transitions.current_state(self._virtual_id)
+        running_target = self._transitions.target_state(self._virtual_id)
+
+        # Start from wherever a running fade is, otherwise from the reported state
+        if current is not None:
+            start_brightness, start_rgb = current
+        elif is_active:
+            start_brightness, start_rgb = effect_config.get("brightness", 1.0), self.rgb_color
+        else:
+            start_brightness, start_rgb = 0.0, None
+
+        # Values not given in this call keep the target of a running fade,
+        # unless that fade is turning the light off
+        if ATTR_BRIGHTNESS in kwargs:
+            target_brightness = kwargs[ATTR_BRIGHTNESS] / 255.0
+        elif running_target is not None and running_target[0] > 0:
+            target_brightness = running_target[0]
+        else:
+            target_brightness = effect_config.get("brightness", 1.0) or 1.0
+
+        if ATTR_RGB_COLOR in kwargs:
+            target_rgb = tuple(kwargs[ATTR_RGB_COLOR])
+        elif running_target is not None:
+            target_rgb = running_target[1]
+        else:
+            target_rgb = start_rgb
+
+        if not is_active:
+            # POST once so the following steps can update the effect in place
+            effect_config["brightness"] = start_brightness
+            await self._client.set_virtual_effect(self._virtual_id, effect_type, effect_config)
+
+        @callback
+        def _async_faded_in() -> None:
+            self.hass.async_create_task(self.coordinator.async_request_refresh())
+
+        self._transitions.async_start(
+            self._virtual_id,
+            effect_type,
+            effect_config,
+            start_brightness,
+            target_brightness,
+            start_rgb or target_rgb,
+            target_rgb,
+            kwargs[ATTR_TRANSITION],
+            _async_faded_in,
+        )
@@ -0,0 +1,181 @@
+"""Performance metrics for the LEDFX integration."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds (in milliseconds) of the latency histogram buckets.
+# Anything slower than the last bound lands in the overflow bucket.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class EndpointStats:
+    """Request statistics for a single API endpoint."""
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "timeouts",
+        "bytes_received",
+        "total_latency",
+        "max_latency",
+        "total_decode",
+        "histogram",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.bytes_received = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.total_decode = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a serializable dict."""
+        completed = self.requests - self.errors - self.timeouts
+        buckets = {f"le_{bound}ms": count for bound, count in zip(LATENCY_BUCKETS_MS, self.histogram)}
+        buckets["overflow"] = self.histogram[-1]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "bytes_received": self.bytes_received,
+            "mean_latency_ms": _ms(self.total_latency / self.requests) if self.requests else None,
+            "max_latency_ms": _ms(self.max_latency),
+            "mean_decode_ms": _ms(self.total_decode / completed) if completed > 0 else None,
+            "latency_histogram": buckets,
+        }
+
+
+class LEDFXMetrics:
+    """Collect request and poll timings for one LEDFX server.
+
+    All record methods return immediately when metrics are disabled, so the
+    instrumented code paths cost a single attribute check in that case.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize the metrics collector."""
+        self.enabled = enabled
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.polls = 0
+        self.poll_failures = 0
+        self.last_poll_duration: float | None = None
+        self.max_poll_duration = 0.0
+        self.total_poll_duration = 0.0
+        self.last_entities_notified = 0
+        self.last_notify_duration: float | None = None
+
+    def record_request(
+        self,
+        endpoint: str,
+        latency: float,
+        bytes_received: int = 0,
+        decode_time: float = 0.0,
+        error: bool = False,
+        timeout: bool = False,
+    ) -> None:
+        """Record a finished request (durations in seconds)."""
+        if not self.enabled:
+            return
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        stats.requests += 1
+        stats.errors += error
+        stats.timeouts += timeout
+        stats.bytes_received += bytes_received
+        stats.total_latency += latency
+        stats.total_decode += decode_time
+        if latency > stats.max_latency:
+            stats.max_latency = latency
+        stats.histogram[bisect_left(LATENCY_BUCKETS_MS, latency * 1000)] += 1
+
+    def record_poll(self, duration: float, success: bool) -> None:
+        """Record a coordinator poll (duration in seconds)."""
+        if not self.enabled:
+            return
+        self.polls += 1
+        if not success:
+            self.poll_failures += 1
+        self.last_poll_duration = duration
+        self.total_poll_duration += duration
+        if duration > self.max_poll_duration:
+            self.max_poll_duration = duration
+
+    def record_notify(self, entities: int, duration: float) -> None:
+        """Record how many entities were notified after a poll and how long it took."""
+        if not self.enabled:
+            return
+        self.last_entities_notified = entities
+        self.last_notify_duration = duration
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests across all endpoints."""
+        return sum(stats.requests for stats in self.endpoints.values())
+
+    @property
+    def total_errors(self) -> int:
+        """Return the number of failed requests across all endpoints."""
+        return sum(stats.errors for stats in self.endpoints.values())
+
+    @property
+    def total_timeouts(self) -> int:
+        """Return the number of timed out requests across all endpoints."""
+        return sum(stats.timeouts for stats in self.endpoints.values())
+
+    @property
+    def total_bytes_received(self) -> int:
+        """Return the number of bytes received across all endpoints."""
+        return sum(stats.bytes_received for stats in self.endpoints.values())
+
+    @property
+    def mean_latency_ms(self) -> float | None:
+        """Return the mean request latency across all endpoints."""
+        requests = self.total_requests
+        if not requests:
+            return None
+        return _ms(sum(stats.total_latency for stats in self.endpoints.values()) / requests)
+
+    @property
+    def last_poll_duration_ms(self) -> float | None:
+        """Return the duration of the last poll."""
+        return _ms(self.last_poll_duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics as a serializable dict."""
+        return {
+            "enabled": self.enabled,
+            "totals": {
+                "requests": self.total_requests,
+                "errors": self.total_errors,
+                "timeouts": self.total_timeouts,
+                "bytes_received": self.total_bytes_received,
+                "mean_latency_ms": self.mean_latency_ms,
+            },
+            "endpoints": {
+                endpoint: stats.as_dict()
+                for endpoint, stats in sorted(self.endpoints.items())
+            },
+            "polls": {
+                "count": self.polls,
+                "failures": self.poll_failures,
+                "last_duration_ms": self.last_poll_duration_ms,
+                "mean_duration_ms": _ms(self.total_poll_duration / self.polls) if self.polls else None,
+                "max_duration_ms": _ms(self.max_poll_duration),
+                "last_entities_notified": self.last_entities_notified,
+                "last_notify_duration_ms": _ms(self.last_notify_duration),
+            },
+        }
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    if seconds is None:
+        return None
+    return round(seconds * 1000, 2)
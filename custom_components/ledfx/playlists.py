@@ -0,0 +1,164 @@
+"""Server-side effect playlists for the LEDFX integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    PLAYLIST_ACTION_NEXT,
+    PLAYLIST_ACTION_START,
+    PLAYLIST_ACTION_STOP,
+    WS_EVENT_PLAYLIST_STARTED,
+    WS_EVENT_PLAYLIST_STOPPED,
+)
+from .ledfx_client import LEDFXClient
+from .stream import LEDFXEventStream
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LEDFXPlaylists:
+    """Playlist catalog of a LEDFX server and the playlist it is running.
+
+    Playlists run on the LEDFX server, Home Assistant only starts, stops and
+    advances them. The catalog is fetched once during setup and only fetched
+    again when asked for, or told about, a playlist it does not know, so
+    starting a playlist takes a single request. The running playlist follows
+    the server's playlist events, so it is only known after the first start
+    or stop, wherever it came from.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, client: LEDFXClient, playlists: dict[str, Any]
+    ) -> None:
+        """Initialize the catalog."""
+        self.hass = hass
+        self._client = client
+        self._names: dict[str, str] = {}
+        self._listeners: list[Callable[[], None]] = []
+        # Playlist id, None when stopped
+        self.active: str | None = None
+        # None until a playlist was started or stopped
+        self.running: bool | None = None
+        self._set_catalog(playlists)
+
+    def _set_catalog(self, playlists: dict[str, Any]) -> None:
+        """Index the playlists by name."""
+        self._names = {
+            playlist.get("name") or playlist_id: playlist_id
+            for playlist_id, playlist in playlists.items()
+        }
+
+    @property
+    def names(self) -> list[str]:
+        """Return the sorted playlist names."""
+        return sorted(self._names)
+
+    @property
+    def active_name(self) -> str | None:
+        """Return the name of the running playlist."""
+        for name, playlist_id in self._names.items():
+            if playlist_id == self.active:
+                return name
+        return None
+
+    def lookup(self, playlist: str) -> str | None:
+        """Return the id of a playlist given by name or id."""
+        if playlist in self._names:
+            return self._names[playlist]
+        if playlist in self._names.values():
+            return playlist
+        return None
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Listen for catalog and playback changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify(self) -> None:
+        """Notify listeners."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_track(self, stream: LEDFXEventStream) -> Callable[[], None]:
+        """Follow playlist starts and stops on the server, including its own."""
+        unsubs = [
+            stream.async_subscribe(event_type, self.handle_message)
+            for event_type in (WS_EVENT_PLAYLIST_STARTED, WS_EVENT_PLAYLIST_STOPPED)
+        ]
+
+        @callback
+        def unsubscribe() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return unsubscribe
+
+    @callback
+    def handle_message(self, message: dict[str, Any]) -> None:
+        """Update the running playlist from a server event."""
+        if message.get("event_type") == WS_EVENT_PLAYLIST_STARTED:
+            self.active = message.get("playlist_id")
+            self.running = True
+            if self.active is not None and self.lookup(self.active) is None:
+                # Started in LEDFX after the catalog was fetched
+                self.hass.async_create_task(self.async_refresh())
+        else:
+            self.active = None
+            self.running = False
+        self._async_notify()
+
+    async def async_refresh(self) -> None:
+        """Fetch the catalog again."""
+        try:
+            playlists = await self._client.get_playlists()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("Error refreshing playlists: %s", err)
+            return
+        self._set_catalog(playlists or {})
+        self._async_notify()
+
+    async def async_start(self, playlist: str) -> bool:
+        """Start a playlist given by name or id."""
+        playlist_id = self.lookup(playlist)
+        if playlist_id is None:
+            # It may have been created after the catalog was fetched
+            await self.async_refresh()
+            playlist_id = self.lookup(playlist)
+        if playlist_id is None:
+            _LOGGER.error("Unknown LEDFX playlist %s", playlist)
+            return False
+
+        if not await self._client.control_playlist(PLAYLIST_ACTION_START, playlist_id):
+            return False
+        self.active = playlist_id
+        self.running = True
+        self._async_notify()
+        return True
+
+    async def async_stop(self) -> bool:
+        """Stop the running playlist."""
+        if not await self._client.control_playlist(PLAYLIST_ACTION_STOP):
+            return False
+        self.active = None
+        self.running = False
+        self._async_notify()
+        return True
+
+    async def async_next(self) -> bool:
+        """Skip to the next item of the running playlist."""
+        return await self._client.control_playlist(PLAYLIST_ACTION_NEXT)
@@ -0,0 +1,135 @@
+"""Effect preset catalog for the LEDFX integration."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections.abc import Callable
+import logging
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    PRESET_CATEGORY_USER,
+    PRESET_FETCH_CONCURRENCY,
+    PRESETS_STORAGE_VERSION,
+)
+from .ledfx_client import LEDFXClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def catalog_signature(version: str | None, effects: dict[str, Any]) -> str:
+    """Return a fingerprint of the server version and effect schema."""
+    digest = hashlib.sha1(json.dumps(effects, sort_keys=True).encode())
+    return f"{version}:{digest.hexdigest()}"
+
+
+class LEDFXPresetCatalog:
+    """Preset names of every effect, cached per config entry.
+
+    The catalog is persisted and only fetched again when the LEDFX version or
+    effect schema changes. Lookups are served from a local index, so picking
+    a preset never needs more than the one request that applies it. The
+    catalog is loaded after setup, listeners are notified once it is in.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: LEDFXClient, entry_id: str) -> None:
+        """Initialize the catalog."""
+        self._client = client
+        self._store = Store(hass, PRESETS_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.presets")
+        # effect id -> label -> (category, preset id)
+        self._index: dict[str, dict[str, tuple[str, str]]] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    @staticmethod
+    async def async_remove(hass: HomeAssistant, entry_id: str) -> None:
+        """Delete the persisted catalog of a config entry."""
+        await Store(hass, PRESETS_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.presets").async_remove()
+
+    async def async_load(self, version: str | None, effects: dict[str, Any]) -> None:
+        """Load the catalog, fetching it from LEDFX only when it is stale."""
+        signature = catalog_signature(version, effects)
+        stored = await self._store.async_load()
+
+        if stored and stored.get("signature") == signature:
+            catalog = stored["presets"]
+        else:
+            catalog, complete = await self._async_fetch(effects)
+            # A partial catalog is used but not persisted, so the next start retries
+            if complete:
+                await self._store.async_save({"signature": signature, "presets": catalog})
+
+        self._index = {
+            effect_id: {label: tuple(target) for label, target in presets.items()}
+            for effect_id, presets in catalog.items()
+        }
+        self._async_notify()
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Listen for the catalog being loaded."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify(self) -> None:
+        """Notify listeners."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    async def _async_fetch(
+        self, effects: dict[str, Any]
+    ) -> tuple[dict[str, dict[str, list[str]]], bool]:
+        """Fetch the presets of all effects, a few at a time."""
+        effect_ids = list(effects)
+        semaphore = asyncio.Semaphore(PRESET_FETCH_CONCURRENCY)
+
+        async def fetch(effect_id: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self._client.get_effect_presets(effect_id)
+
+        results = await asyncio.gather(
+            *(fetch(effect_id) for effect_id in effect_ids),
+            return_exceptions=True,
+        )
+
+        catalog: dict[str, dict[str, list[str]]] = {}
+        complete = True
+        for effect_id, result in zip(effect_ids, results):
+            if isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError)):
+                complete = False
+                continue
+            if isinstance(result, BaseException):
+                raise result
+
+            labels: dict[str, list[str]] = {}
+            for category, presets in result.items():
+                for preset_id, preset in presets.items():
+                    label = preset.get("name", preset_id)
+                    if category == PRESET_CATEGORY_USER:
+                        label = f"{label} (user)"
+                    labels[label] = [category, preset_id]
+            if labels:
+                catalog[effect_id] = labels
+
+        _LOGGER.debug("Fetched presets for %s of %s effects", len(catalog), len(effect_ids))
+        return catalog, complete
+
+    def labels(self, effect_id: str | None) -> list[str]:
+        """Return the preset labels of an effect."""
+        return list(self._index.get(effect_id, {}))
+
+    def lookup(self, effect_id: str, label: str) -> tuple[str, str] | None:
+        """Return the category and preset id behind a label."""
+        return self._index.get(effect_id, {}).get(label)
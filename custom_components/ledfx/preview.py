@@ -0,0 +1,137 @@
+"""Live pixel preview of LEDFX virtuals."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
+import logging
+import struct
+import time
+from typing import Any
+import zlib
+
+import numpy as np
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import PREVIEW_IDLE_TIMEOUT, WS_EVENT_VISUALISATION
+from .stream import LEDFXEventStream
+
+_LOGGER = logging.getLogger(__name__)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def downsample(pixels: Any, width: int) -> np.ndarray:
+    """Average a strip of RGB pixels down to at most ``width`` pixels.
+
+    Accepts LEDFX's channel-major ``[[r...], [g...], [b...]]`` layout as well
+    as a list of ``[r, g, b]`` triplets.
+    """
+    frame = np.asarray(pixels, dtype=np.float32)
+    if frame.ndim == 2 and frame.shape[0] == 3 and frame.shape[1] != 3:
+        frame = frame.T
+    frame = frame.reshape(-1, 3)
+
+    count = len(frame)
+    if count == 0:
+        return np.zeros((1, 3), dtype=np.uint8)
+    if count > width:
+        # Each output pixel is the mean of an (almost) equal share of the strip
+        edges = np.arange(width) * count // width
+        sizes = np.diff(np.append(edges, count))
+        frame = np.add.reduceat(frame, edges, axis=0) / sizes[:, None]
+
+    return np.clip(frame, 0, 255).astype(np.uint8)
+
+
+def encode_png(image: np.ndarray) -> bytes:
+    """Encode an (height, width, 3) uint8 array as an RGB PNG."""
+    height, width, _ = image.shape
+    # Every scanline starts with filter type 0 (None)
+    raw = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    raw[:, 1:] = image.reshape(height, width * 3)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + tag
+            + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+        )
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        PNG_SIGNATURE
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), 1))
+        + chunk(b"IEND", b"")
+    )
+
+
+def render_preview(pixels: Any, width: int, height: int) -> bytes:
+    """Render a pixel frame as a small PNG strip."""
+    row = downsample(pixels, width)
+    return encode_png(np.broadcast_to(row, (height, len(row), 3)))
+
+
+class LEDFXPixelPreview:
+    """Follow the pixel stream of one virtual while someone is watching.
+
+    The subscription on the server's event stream starts on the first frame
+    request and is dropped again after ``PREVIEW_IDLE_TIMEOUT`` seconds
+    without one. Incoming frames are only stored; converting them is left to
+    the viewer, so frames nobody looks at cost nothing but the assignment.
+    """
+
+    def __init__(self, hass: HomeAssistant, stream: LEDFXEventStream, virtual_id: str) -> None:
+        """Initialize the preview."""
+        self.hass = hass
+        self.virtual_id = virtual_id
+        self.pixels: Any = None
+        self._stream = stream
+        self._last_access = 0.0
+        self._unsub_stream: Callable[[], None] | None = None
+        self._unsub_idle: Callable[[], None] | None = None
+
+    @property
+    def subscribed(self) -> bool:
+        """Return if the pixel stream is being followed."""
+        return self._unsub_stream is not None
+
+    @callback
+    def async_touch(self) -> None:
+        """Note a viewer and subscribe if needed."""
+        self._last_access = time.monotonic()
+        if self._unsub_stream is not None:
+            return
+        # LEDFX only sends frames of this virtual, not of every virtual
+        self._unsub_stream = self._stream.async_subscribe(
+            WS_EVENT_VISUALISATION, self.handle_message, {"vis_id": self.virtual_id}
+        )
+        self._unsub_idle = async_track_time_interval(
+            self.hass, self._async_check_idle, timedelta(seconds=PREVIEW_IDLE_TIMEOUT / 2)
+        )
+
+    @callback
+    def _async_check_idle(self, _now: Any) -> None:
+        """Unsubscribe when nobody asked for a frame for a while."""
+        if time.monotonic() - self._last_access > PREVIEW_IDLE_TIMEOUT:
+            self.async_stop()
+
+    @callback
+    def async_stop(self) -> None:
+        """Unsubscribe from the pixel stream."""
+        if self._unsub_idle is not None:
+            self._unsub_idle()
+            self._unsub_idle = None
+        if self._unsub_stream is not None:
+            self._unsub_stream()
+            self._unsub_stream = None
+        self.pixels = None
+
+    @callback
+    def handle_message(self, message: dict[str, Any]) -> None:
+        """Keep the latest frame of our virtual."""
+        if "pixels" in message:
+            self.pixels = message["pixels"]
@@ -0,0 +1,132 @@
+"""On-demand profiling for the LEDFX integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import cProfile
+import io
+import logging
+import os
+import pstats
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .const import MAX_PROFILE_DURATION
+
+_LOGGER = logging.getLogger(__name__)
+
+PACKAGE_DIR = os.path.dirname(__file__)
+NOTIFICATION_ID = "ledfx_profile"
+SUMMARY_ROWS = 15
+
+
+async def async_run_profile(
+    hass: HomeAssistant,
+    coordinators: list[DataUpdateCoordinator],
+    duration: float | None,
+    polls: int | None,
+) -> None:
+    """Profile the event loop for a duration or a number of polls.
+
+    cProfile hooks the whole event loop thread, so coordinator updates,
+    entity property evaluation and client commands are all captured. The
+    summary only lists functions from this integration; the full data is
+    written next to it for use with snakeviz or pstats.
+    """
+    profiler = cProfile.Profile()
+    done = asyncio.Event()
+    poll_counts = [0] * len(coordinators)
+
+    def _poll_finished(index: int) -> Callable[[], None]:
+        """Return a listener counting the polls of one coordinator."""
+
+        @callback
+        def _async_poll_finished() -> None:
+            """Stop profiling once every server has completed enough polls."""
+            poll_counts[index] += 1
+            if polls and min(poll_counts) >= polls:
+                done.set()
+
+        return _async_poll_finished
+
+    started = dt_util.utcnow()
+    timeout = duration if duration else MAX_PROFILE_DURATION
+
+    try:
+        profiler.enable()
+    except ValueError as err:
+        # Only one profiler can be active per thread, e.g. HA's own profiler
+        persistent_notification.async_create(
+            hass,
+            f"Could not start profiling: {err}. Stop the other profiler and try again.",
+            title="LEDFX profile",
+            notification_id=NOTIFICATION_ID,
+        )
+        _LOGGER.error("Could not start LEDFX profile: %s", err)
+        return
+
+    unsubs = [
+        coordinator.async_add_listener(_poll_finished(index))
+        for index, coordinator in enumerate(coordinators)
+    ]
+    try:
+        await asyncio.wait_for(done.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        profiler.disable()
+        for unsub in unsubs:
+            unsub()
+
+    elapsed = (dt_util.utcnow() - started).total_seconds()
+    base_path = hass.config.path(f"ledfx_profile_{started:%Y%m%d_%H%M%S}")
+    summary = await hass.async_add_executor_job(
+        _write_results, profiler, base_path
+    )
+
+    persistent_notification.async_create(
+        hass,
+        (
+            f"Profiled {elapsed:.1f} s covering {sum(poll_counts)} poll(s) "
+            f"on {len(coordinators)} server(s).\n\n"
+            f"Full results: `{base_path}.prof`\n\n"
+            f"{summary}"
+        ),
+        title="LEDFX profile",
+        notification_id=NOTIFICATION_ID,
+    )
+    _LOGGER.info("LEDFX profile written to %s.prof", base_path)
+
+
+def _write_results(profiler: cProfile.Profile, base_path: str) -> str:
+    """Dump profile data and a text report, return a markdown summary."""
+    profiler.dump_stats(f"{base_path}.prof")
+
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(50)
+    with open(f"{base_path}.txt", "w", encoding="utf-8") as file:
+        file.write(report.getvalue())
+
+    # (filename, line, function) -> (primitive calls, calls, own time, cumulative time, callers)
+    rows = [
+        (key, value)
+        for key, value in stats.stats.items()
+        if key[0].startswith(PACKAGE_DIR)
+    ]
+    rows.sort(key=lambda row: row[1][3], reverse=True)
+
+    if not rows:
+        return "No LEDFX code ran while profiling."
+
+    lines = ["| Function | Calls | Own (ms) | Cumulative (ms) |", "|---|---|---|---|"]
+    for (filename, lineno, function), (_, calls, own, cumulative, _) in rows[:SUMMARY_ROWS]:
+        location = f"{os.path.basename(filename)}:{lineno}"
+        lines.append(
+            f"| `{function}` ({location}) | {calls} | {own * 1000:.2f} | {cumulative * 1000:.2f} |"
+        )
+    return "\n".join(lines)
+
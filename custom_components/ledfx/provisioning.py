@@ -0,0 +1,173 @@
+"""Per-virtual entity provisioning for the LEDFX integration."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterable
+import logging
+from typing import Any
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    ENTITY_KIND_EFFECT_REACTIVE,
+    ENTITY_KIND_EFFECT_STATIC,
+    ENTITY_KIND_GRADIENT,
+    ENTITY_KIND_LIGHT,
+    ENTITY_KIND_PRESET,
+    ENTITY_KIND_PREVIEW,
+    ENTITY_KIND_SWITCH,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+EntityFactory = Callable[[str, dict[str, Any]], Entity]
+
+# Platform and unique id suffix of each entity kind, after "ledfx_<virtual id>"
+ENTITY_KIND_UNIQUE_IDS: dict[str, tuple[Platform, str]] = {
+    ENTITY_KIND_SWITCH: (Platform.SWITCH, ""),
+    ENTITY_KIND_LIGHT: (Platform.LIGHT, ""),
+    ENTITY_KIND_EFFECT_REACTIVE: (Platform.SELECT, "_effect_reactive"),
+    ENTITY_KIND_EFFECT_STATIC: (Platform.SELECT, "_effect_static"),
+    ENTITY_KIND_GRADIENT: (Platform.SELECT, "_gradient"),
+    ENTITY_KIND_PRESET: (Platform.SELECT, "_preset"),
+    ENTITY_KIND_PREVIEW: (Platform.CAMERA, "_preview"),
+}
+
+
+def entity_kind_of(platform: str, unique_id: str) -> tuple[str, str] | None:
+    """Return the entity kind and virtual id behind a unique id.
+
+    Server entities such as sensors and the playlist select are not per
+    virtual and return None.
+    """
+    if not unique_id.startswith("ledfx_"):
+        return None
+    for kind, (kind_platform, suffix) in ENTITY_KIND_UNIQUE_IDS.items():
+        if platform != kind_platform or not unique_id.endswith(suffix):
+            continue
+        virtual_id = unique_id[len("ledfx_") : len(unique_id) - len(suffix)]
+        if virtual_id:
+            return kind, virtual_id
+    return None
+
+
+class LEDFXProvisioner:
+    """Create entities only for the enabled virtuals and entity kinds.
+
+    Platforms hand in one factory per entity kind instead of building every
+    entity up front. Disabled kinds are never instantiated, so they are not
+    registered, not subscribed to the coordinator and not recorded. When the
+    options change, newly enabled entities are created and disabled ones are
+    removed without reloading the config entry. Virtuals that show up in a
+    later poll are provisioned as well. ``refresh`` runs before entities are
+    created after setup, so they are not built from stale setup data.
+    Entities of kinds or virtuals disabled while the entry was not loaded are
+    removed from the registry at setup.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: DataUpdateCoordinator,
+        kinds: Iterable[str],
+        virtuals: Iterable[str] | None,
+        refresh: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        """Initialize the provisioner."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.kinds = set(kinds)
+        # None provisions every virtual
+        self.virtuals = set(virtuals) if virtuals is not None else None
+        self._platforms: list[tuple[dict[str, EntityFactory], AddEntitiesCallback]] = []
+        self._entities: dict[tuple[str, str], Entity] = {}
+        self._known_virtuals: set[str] = set(coordinator.data or {})
+        self._refresh = refresh
+
+    def is_enabled(self, kind: str, virtual_id: str) -> bool:
+        """Return if an entity kind is wanted for a virtual."""
+        return kind in self.kinds and (self.virtuals is None or virtual_id in self.virtuals)
+
+    @callback
+    def async_remove_disabled(self, config_entry_id: str) -> None:
+        """Remove registry entries of entities that are no longer enabled."""
+        registry = er.async_get(self.hass)
+        for registry_entry in er.async_entries_for_config_entry(registry, config_entry_id):
+            key = entity_kind_of(registry_entry.domain, registry_entry.unique_id)
+            if key is not None and not self.is_enabled(*key):
+                _LOGGER.debug("Removing disabled LEDFX entity %s", registry_entry.entity_id)
+                registry.async_remove(registry_entry.entity_id)
+
+    @callback
+    def async_add_platform(
+        self,
+        factories: dict[str, EntityFactory],
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Register the entity kinds of a platform and create the enabled ones."""
+        self._platforms.append((factories, async_add_entities))
+        self._async_add_missing(factories, async_add_entities)
+
+    @callback
+    def _async_add_missing(
+        self,
+        factories: dict[str, EntityFactory],
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Create enabled entities that do not exist yet."""
+        entities = []
+        for virtual_id, virtual_data in self.coordinator.data.items():
+            for kind, factory in factories.items():
+                key = (kind, virtual_id)
+                if key in self._entities or not self.is_enabled(kind, virtual_id):
+                    continue
+                entity = self._entities[key] = factory(virtual_id, virtual_data)
+                entities.append(entity)
+
+        if entities:
+            async_add_entities(entities)
+
+    @callback
+    def async_track_virtuals(self) -> Callable[[], None]:
+        """Provision virtuals added to LEDFX after setup."""
+
+        @callback
+        def _async_coordinator_updated() -> None:
+            virtual_ids = set(self.coordinator.data or {})
+            if virtual_ids <= self._known_virtuals:
+                return
+            self._known_virtuals |= virtual_ids
+            self.hass.async_create_task(self._async_add_all_missing())
+
+        return self.coordinator.async_add_listener(_async_coordinator_updated)
+
+    async def _async_add_all_missing(self) -> None:
+        """Refresh setup data, then create missing entities on every platform."""
+        if self._refresh is not None:
+            await self._refresh()
+        for factories, async_add_entities in self._platforms:
+            self._async_add_missing(factories, async_add_entities)
+
+    async def async_update(self, kinds: Iterable[str], virtuals: Iterable[str] | None) -> None:
+        """Apply new provisioning options."""
+        self.kinds = set(kinds)
+        self.virtuals = set(virtuals) if virtuals is not None else None
+
+        # Removing the registry entry also removes the entity from its platform
+        registry = er.async_get(self.hass)
+        for key, entity in list(self._entities.items()):
+            if self.is_enabled(*key):
+                continue
+            del self._entities[key]
+            if entity.entity_id and registry.async_get(entity.entity_id):
+                registry.async_remove(entity.entity_id)
+            else:
+                self.hass.async_create_task(entity.async_remove())
+
+        await self._async_add_all_missing()
+
+        _LOGGER.debug("LEDFX now provides %s entities", len(self._entities))
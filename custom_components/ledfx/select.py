@@ -6,15 +6,32 @@ from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
 )
 
-from .const import DOMAIN, GRADIENT_PRESETS, AUDIO_REACTIVE_CATEGORIES, NON_REACTIVE_CATEGORIES
+from .bootstrap import LEDFXSnapshot
+from .const import (
+    AUDIO_REACTIVE_CATEGORIES,
+    DOMAIN,
+    ENTITY_KIND_EFFECT_REACTIVE,
+    ENTITY_KIND_EFFECT_STATIC,
+    ENTITY_KIND_GRADIENT,
+    ENTITY_KIND_PRESET,
+    GRADIENT_PRESETS,
+    NON_REACTIVE_CATEGORIES,
+    PLAYLIST_OFF,
+)
+from .effect_memory import LEDFXEffectMemory
 from .ledfx_client import LEDFXClient
+from .playlists import LEDFXPlaylists
+from .presets import LEDFXPresetCatalog
+from .provisioning import LEDFXProvisioner
+from .transition import LEDFXTransitionScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,56 +43,60 @@ async def async_setup_entry(
 ) -> None:
     """Set up LEDFX select entities."""
     client: LEDFXClient = hass.data[DOMAIN][config_entry.entry_id]
-    
-    # Try to get coordinator from light platform, or create it if it doesn't exist yet
-    coordinator = hass.data[DOMAIN].get(f"{config_entry.entry_id}_coordinator")
-    
-    if not coordinator:
-        # Light platform hasn't been loaded yet, create coordinator here
-        from datetime import timedelta
-        
-        async def async_update_data():
-            """Fetch data from LEDFX."""
-            try:
-                return await client.get_virtuals()
-            except Exception as err:
-                from homeassistant.helpers.update_coordinator import UpdateFailed
-                raise UpdateFailed(f"Error communicating with LEDFX: {err}") from err
-        
-        coordinator = DataUpdateCoordinator(
-            hass,
-            _LOGGER,
-            name="ledfx",
-            update_method=async_update_data,
-            update_interval=timedelta(seconds=30),
-        )
-        
-        await coordinator.async_config_entry_first_refresh()
-        
-        # Store it for light platform to use
-        hass.data[DOMAIN][f"{config_entry.entry_id}_coordinator"] = coordinator
-    
-    # Fetch devices to get online status
-    try:
-        devices = await client.get_devices()
-    except Exception as err:
-        _LOGGER.error("Failed to get devices: %s", err)
-        devices = {}
-
-    entities = []
-    for virtual_id, virtual_data in coordinator.data.items():
-        # Get device status
-        device_id = virtual_data.get("is_device")
-        device_online = devices.get(device_id, {}).get("online", True) if device_id else True
-        
-        # Add audio-reactive effect selector
-        entities.append(LEDFXEffectSelect(coordinator, client, virtual_id, virtual_data, device_online, is_reactive=True))
-        # Add non-reactive effect selector
-        entities.append(LEDFXEffectSelect(coordinator, client, virtual_id, virtual_data, device_online, is_reactive=False))
-        # Add gradient selector
-        entities.append(LEDFXGradientSelect(coordinator, client, virtual_id, virtual_data, device_online))
+    coordinator = hass.data[DOMAIN][f"{config_entry.entry_id}_coordinator"]
+    presets: LEDFXPresetCatalog = hass.data[DOMAIN][f"{config_entry.entry_id}_presets"]
+    effect_memory: LEDFXEffectMemory = hass.data[DOMAIN][f"{config_entry.entry_id}_effect_memory"]
+    transitions: LEDFXTransitionScheduler = hass.data[DOMAIN][f"{config_entry.entry_id}_transitions"]
+    provisioner: LEDFXProvisioner = hass.data[DOMAIN][f"{config_entry.entry_id}_provisioner"]
+
+    # Device status and effects come from the snapshot taken during setup
+    snapshot: LEDFXSnapshot = hass.data[DOMAIN][f"{config_entry.entry_id}_snapshot"]
+    device_online = snapshot.device_online
 
-    async_add_entities(entities)
+    # Filter effects by category once, all selectors share the lists
+    reactive_effects = filter_effects(snapshot.effects, AUDIO_REACTIVE_CATEGORIES)
+    static_effects = filter_effects(snapshot.effects, NON_REACTIVE_CATEGORIES)
+
+    # Entities are only created for enabled virtuals and kinds
+    provisioner.async_add_platform(
+        {
+            # Audio-reactive effect selector
+            ENTITY_KIND_EFFECT_REACTIVE: lambda virtual_id, virtual_data: LEDFXEffectSelect(
+                coordinator, client, virtual_id, virtual_data, device_online(virtual_data),
+                snapshot.effects, reactive_effects, effect_memory, transitions, is_reactive=True
+            ),
+            # Non-reactive effect selector
+            ENTITY_KIND_EFFECT_STATIC: lambda virtual_id, virtual_data: LEDFXEffectSelect(
+                coordinator, client, virtual_id, virtual_data, device_online(virtual_data),
+                snapshot.effects, static_effects, effect_memory, transitions, is_reactive=False
+            ),
+            # Gradient selector
+            ENTITY_KIND_GRADIENT: lambda virtual_id, virtual_data: LEDFXGradientSelect(
+                coordinator, client, virtual_id, virtual_data, device_online(virtual_data),
+                effect_memory, transitions
+            ),
+            # Effect preset selector
+            ENTITY_KIND_PRESET: lambda virtual_id, virtual_data: LEDFXPresetSelect(
+                coordinator, client, presets, virtual_id, virtual_data, device_online(virtual_data),
+                transitions
+            ),
+        },
+        async_add_entities,
+    )
+
+    # Playlists belong to the server and only exist if it supports them
+    playlists: LEDFXPlaylists | None = hass.data[DOMAIN][f"{config_entry.entry_id}_playlists"]
+    if playlists is not None:
+        async_add_entities([LEDFXPlaylistSelect(playlists, config_entry)])
+
+
+def filter_effects(effects: dict[str, Any], categories: set[str]) -> list[str]:
+    """Return the sorted names of the effects in the given categories."""
+    return sorted(
+        effect_name
+        for effect_name, effect_data in effects.items()
+        if effect_data.get("category", "") in categories
+    )
 
 
 class LEDFXEffectSelect(CoordinatorEntity, SelectEntity):
@@ -90,11 +111,17 @@ class LEDFXEffectSelect(CoordinatorEntity, SelectEntity):
         virtual_id: str,
         virtual_data: dict[str, Any],
         device_online: bool,
+        effects: dict[str, Any],
+        effects_list: list[str],
+        effect_memory: LEDFXEffectMemory,
+        transitions: LEDFXTransitionScheduler,
         is_reactive: bool = True,
     ) -> None:
         """Initialize the select."""
         super().__init__(coordinator)
         self._client = client
+        self._effect_memory = effect_memory
+        self._transitions = transitions
         self._virtual_id = virtual_id
         self._is_reactive = is_reactive
         
@@ -106,10 +133,10 @@ class LEDFXEffectSelect(CoordinatorEntity, SelectEntity):
             self._attr_unique_id = f"ledfx_{virtual_id}_effect_static"
             self._attr_name = "Effect (Static)"
             
-        self._effects_list: list[str] = []
-        self._effects_data: dict[str, Any] = {}
+        self._effects_list = effects_list
+        self._effects_data = effects
         self._current_effect: str | None = None
-        self._attr_options: list[str] = []  # Initialize options as empty list
+        self._attr_options = effects_list
         self._device_online = device_online
         
         # Device info for grouping
@@ -126,42 +153,6 @@ class LEDFXEffectSelect(CoordinatorEntity, SelectEntity):
         """Return virtual data from coordinator."""
         return self.coordinator.data.get(self._virtual_id, {})
 
-    async def async_added_to_hass(self) -> None:
-        """When entity is added to hass."""
-        await super().async_added_to_hass()
-        await self._update_available_effects()
-        # Do initial update to get current effect
-        await self.async_update()
-
-    async def _update_available_effects(self) -> None:
-        """Fetch available effects from LEDFX and filter by category."""
-        try:
-            effects = await self._client.get_effects()
-            self._effects_data = effects
-            
-            # Filter effects based on is_reactive flag
-            filtered_effects = {}
-            for effect_name, effect_data in effects.items():
-                category = effect_data.get("category", "")
-                
-                if self._is_reactive:
-                    # Include audio-reactive categories
-                    if category in AUDIO_REACTIVE_CATEGORIES:
-                        filtered_effects[effect_name] = effect_data
-                else:
-                    # Include non-reactive categories
-                    if category in NON_REACTIVE_CATEGORIES:
-                        filtered_effects[effect_name] = effect_data
-            
-            # Create a sorted list of filtered effect names
-            self._effects_list = sorted(filtered_effects.keys())
-            self._attr_options = self._effects_list
-            
-        except Exception as err:
-            _LOGGER.error("Error fetching effects: %s", err)
-            self._effects_list = []
-            self._attr_options = []
-    
     @property
     def options(self) -> list[str]:
         """Return available options."""
@@ -194,26 +185,41 @@ class LEDFXEffectSelect(CoordinatorEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         """Change the selected effect."""
         try:
-            # Get current virtual state to preserve settings
-            current_config = {}
-            
-            if self.virtual_data.get("effect", {}).get("config"):
-                current_config = self.virtual_data["effect"]["config"].copy()
-            
-            # Get default config for the new effect
-            effect_schema = self._effects_data.get(option, {})
-            default_config = {}
-            
-            # Build default config from schema
-            if "schema" in effect_schema:
-                schema = effect_schema["schema"]
-                for key, value in schema.items():
-                    if isinstance(value, dict) and "default" in value:
-                        default_config[key] = value["default"]
-            
-            # Merge: prefer current settings, fall back to defaults
-            final_config = {**default_config, **current_config}
-            
+            # Remember the settings of the effect we switch away from
+            current_effect = self.virtual_data.get("effect", {})
+            current_config = current_effect.get("config") or {}
+            if current_effect.get("type") and current_config:
+                self._effect_memory.async_remember(
+                    self._virtual_id, current_effect["type"], current_config
+                )
+
+            # Restore the settings this effect was last used with
+            final_config = self._effect_memory.get(self._virtual_id, option)
+
+            if final_config is None:
+                # Get default config for the new effect
+                effect_schema = self._effects_data.get(option, {})
+                default_config = {}
+
+                # Build default config from schema
+                if "schema" in effect_schema:
+                    schema = effect_schema["schema"]
+                    for key, value in schema.items():
+                        if isinstance(value, dict) and "default" in value:
+                            default_config[key] = value["default"]
+
+                    # Only carry over settings the new effect knows about
+                    current_config = {
+                        key: value for key, value in current_config.items() if key in schema
+                    }
+
+                # Merge: prefer current settings, fall back to defaults
+                final_config = {**default_config, **current_config}
+
+            # Override a running fade and undo the dimming of a fade-out
+            self._transitions.async_cancel(self._virtual_id)
+            self._effect_memory.async_restore_brightness(self._virtual_id, final_config)
+
             # Set the new effect (this will activate the virtual)
             await self._client.set_virtual_effect(self._virtual_id, option, final_config)
             
@@ -241,10 +247,14 @@ class LEDFXGradientSelect(CoordinatorEntity, SelectEntity):
         virtual_id: str,
         virtual_data: dict[str, Any],
         device_online: bool,
+        effect_memory: LEDFXEffectMemory,
+        transitions: LEDFXTransitionScheduler,
     ) -> None:
         """Initialize the select."""
         super().__init__(coordinator)
         self._client = client
+        self._effect_memory = effect_memory
+        self._transitions = transitions
         self._virtual_id = virtual_id
         self._attr_unique_id = f"ledfx_{virtual_id}_gradient"
         self._attr_name = "Gradient"
@@ -306,6 +316,10 @@ class LEDFXGradientSelect(CoordinatorEntity, SelectEntity):
             # Get current config and update gradient
             effect_config = effect.get("config", {}).copy()
             effect_config["gradient"] = GRADIENT_PRESETS[option]
+
+            # Override a running fade and undo the dimming of a fade-out
+            self._transitions.async_cancel(self._virtual_id)
+            self._effect_memory.async_restore_brightness(self._virtual_id, effect_config)
             
             # Apply the updated effect with new gradient (this will activate if off)
             await self._client.set_virtual_effect(self._virtual_id, effect_type, effect_config)
@@ -320,3 +334,142 @@ class LEDFXGradientSelect(CoordinatorEntity, SelectEntity):
     def available(self) -> bool:
         """Return if entity is available."""
         return self._device_online
+
+
+class LEDFXPresetSelect(CoordinatorEntity, SelectEntity):
+    """Representation of a LEDFX effect preset selector."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        client: LEDFXClient,
+        presets: LEDFXPresetCatalog,
+        virtual_id: str,
+        virtual_data: dict[str, Any],
+        device_online: bool,
+        transitions: LEDFXTransitionScheduler,
+    ) -> None:
+        """Initialize the select."""
+        super().__init__(coordinator)
+        self._client = client
+        self._presets = presets
+        self._transitions = transitions
+        self._virtual_id = virtual_id
+        self._attr_unique_id = f"ledfx_{virtual_id}_preset"
+        self._attr_name = "Preset"
+        self._device_online = device_online
+        # (effect type, label) of the preset applied last from here
+        self._applied: tuple[str, str] | None = None
+
+        # Device info for grouping
+        virtual_name = virtual_data.get("config", {}).get("name", virtual_id)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, virtual_id)},
+            "name": virtual_name,
+            "manufacturer": "LEDFX",
+            "model": "Virtual LED",
+        }
+
+    @property
+    def virtual_data(self) -> dict[str, Any]:
+        """Return virtual data from coordinator."""
+        return self.coordinator.data.get(self._virtual_id, {})
+
+    @property
+    def effect_type(self) -> str | None:
+        """Return the active effect, or the last one when the virtual is off."""
+        return self.virtual_data.get("effect", {}).get("type") or self.virtual_data.get("last_effect")
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        # The catalog is loaded after setup
+        self.async_on_remove(self._presets.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def options(self) -> list[str]:
+        """Return the presets of the current effect."""
+        return self._presets.labels(self.effect_type)
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the preset applied last, while its effect is still active."""
+        if self._applied and self._applied[0] == self.effect_type:
+            return self._applied[1]
+        return None
+
+    async def async_select_option(self, option: str) -> None:
+        """Apply the selected preset."""
+        effect_type = self.effect_type
+        target = self._presets.lookup(effect_type, option) if effect_type else None
+        if target is None:
+            _LOGGER.error("Unknown preset %s for virtual %s", option, self._virtual_id)
+            return
+
+        category, preset_id = target
+        # The preset brings its own brightness, a running fade would override it
+        self._transitions.async_cancel(self._virtual_id)
+        if await self._client.apply_virtual_preset(self._virtual_id, category, effect_type, preset_id):
+            self._applied = (effect_type, option)
+
+        # Trigger coordinator refresh to update all entities
+        await self.coordinator.async_request_refresh()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self._device_online and bool(self.options)
+
+
+class LEDFXPlaylistSelect(SelectEntity):
+    """Representation of the playlist running on a LEDFX server."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, playlists: LEDFXPlaylists, config_entry: ConfigEntry) -> None:
+        """Initialize the select."""
+        self._playlists = playlists
+        self._attr_unique_id = f"ledfx_{config_entry.entry_id}_playlist"
+        self._attr_name = "Playlist"
+
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, config_entry.entry_id)},
+            "name": config_entry.title,
+            "manufacturer": "LEDFX",
+            "model": "LEDFX Server",
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._playlists.async_add_listener(self._handle_update))
+
+    @callback
+    def _handle_update(self) -> None:
+        """Write the state when the catalog or playback changes."""
+        self.async_write_ha_state()
+
+    @property
+    def options(self) -> list[str]:
+        """Return the playlists, and an option to stop them."""
+        return [PLAYLIST_OFF, *self._playlists.names]
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the running playlist, if known."""
+        if self._playlists.running is None:
+            return None
+        if not self._playlists.running:
+            return PLAYLIST_OFF
+        return self._playlists.active_name
+
+    async def async_select_option(self, option: str) -> None:
+        """Start the selected playlist, or stop playback."""
+        if option == PLAYLIST_OFF:
+            if not await self._playlists.async_stop():
+                raise HomeAssistantError("Could not stop the LEDFX playlist")
+        elif not await self._playlists.async_start(option):
+            raise HomeAssistantError(f"Could not start LEDFX playlist {option}")
@@ -0,0 +1,190 @@
+"""Support for LEDFX sensors."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
+
+from .audio import LEDFXAudioMonitor
+from .const import DOMAIN
+from .metrics import LEDFXMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+# key -> (name, unit, state class, value getter)
+METRIC_SENSORS: dict[str, tuple[str, str | None, SensorStateClass, Callable[[LEDFXMetrics], Any]]] = {
+    "requests": (
+        "Requests",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics.total_requests,
+    ),
+    "request_errors": (
+        "Request errors",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics.total_errors,
+    ),
+    "request_timeouts": (
+        "Request timeouts",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics.total_timeouts,
+    ),
+    "bytes_received": (
+        "Bytes received",
+        UnitOfInformation.BYTES,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics.total_bytes_received,
+    ),
+    "mean_request_latency": (
+        "Mean request latency",
+        UnitOfTime.MILLISECONDS,
+        SensorStateClass.MEASUREMENT,
+        lambda metrics: metrics.mean_latency_ms,
+    ),
+    "last_poll_duration": (
+        "Last poll duration",
+        UnitOfTime.MILLISECONDS,
+        SensorStateClass.MEASUREMENT,
+        lambda metrics: metrics.last_poll_duration_ms,
+    ),
+    "entities_notified": (
+        "Entities notified",
+        None,
+        SensorStateClass.MEASUREMENT,
+        lambda metrics: metrics.last_entities_notified,
+    ),
+}
+
+# key -> (name, unit, state class)
+AUDIO_SENSORS: dict[str, tuple[str, str | None, SensorStateClass]] = {
+    "mean_level": ("Audio level", None, SensorStateClass.MEASUREMENT),
+    "peak_level": ("Audio peak", None, SensorStateClass.MEASUREMENT),
+    "bpm": ("BPM", "bpm", SensorStateClass.MEASUREMENT),
+    "beats": ("Beats", None, SensorStateClass.MEASUREMENT),
+}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up LEDFX sensor entities."""
+    coordinator = hass.data[DOMAIN][f"{config_entry.entry_id}_coordinator"]
+    metrics: LEDFXMetrics = hass.data[DOMAIN][f"{config_entry.entry_id}_metrics"]
+
+    entities = []
+
+    # Diagnostic sensors only exist while metrics collection is enabled
+    if metrics.enabled:
+        for key in METRIC_SENSORS:
+            entities.append(LEDFXMetricSensor(coordinator, metrics, config_entry, key))
+
+    # Audio sensors only exist while the audio stream is followed
+    audio: LEDFXAudioMonitor | None = hass.data[DOMAIN][f"{config_entry.entry_id}_audio"]
+    if audio is not None:
+        for key in AUDIO_SENSORS:
+            entities.append(LEDFXAudioSensor(audio, config_entry, key))
+
+    async_add_entities(entities)
+
+
+class LEDFXMetricSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor exposing one LEDFX performance metric."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        metrics: LEDFXMetrics,
+        config_entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._metrics = metrics
+        name, unit, state_class, value_fn = METRIC_SENSORS[key]
+        self._value_fn = value_fn
+        self._attr_unique_id = f"ledfx_{config_entry.entry_id}_{key}"
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+
+        # Metrics belong to the server, not to a virtual
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, config_entry.entry_id)},
+            "name": config_entry.title,
+            "manufacturer": "LEDFX",
+            "model": "LEDFX Server",
+        }
+
+    @property
+    def native_value(self) -> Any:
+        """Return the current metric value."""
+        return self._value_fn(self._metrics)
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # Metrics stay readable while the server is unreachable
+        return True
+
+
+class LEDFXAudioSensor(SensorEntity):
+    """Sensor exposing one windowed audio statistic."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        audio: LEDFXAudioMonitor,
+        config_entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        self._audio = audio
+        self._key = key
+        name, unit, state_class = AUDIO_SENSORS[key]
+        self._attr_unique_id = f"ledfx_{config_entry.entry_id}_audio_{key}"
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, config_entry.entry_id)},
+            "name": config_entry.title,
+            "manufacturer": "LEDFX",
+            "model": "LEDFX Server",
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._audio.async_add_listener(self._handle_window))
+
+    @callback
+    def _handle_window(self) -> None:
+        """Write the state once per window."""
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> Any:
+        """Return the value of the last window."""
+        if self._audio.data is None:
+            return None
+        return self._audio.data[self._key]
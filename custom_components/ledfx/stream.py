@@ -0,0 +1,153 @@
+"""Shared websocket event stream of a LEDFX server."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+import itertools
+import logging
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import WS_RECONNECT_INTERVAL
+from .ledfx_client import LEDFXClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LEDFXEventStream:
+    """Follow the events of one LEDFX server over a single websocket.
+
+    Audio sensors, preview cameras and playlists subscribe here instead of
+    opening a websocket each. The connection is opened for the first
+    subscription and closed after the last one is removed. Subscriptions
+    made while connected are sent over the open socket, and all of them are
+    sent again after a reconnect. An event that a handler fails on is logged
+    and skipped. ``source`` replaces the websocket, tests can hand in a fake
+    stream.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: LEDFXClient,
+        source: Callable[[], AsyncIterator[dict[str, Any]]] | None = None,
+    ) -> None:
+        """Initialize the stream."""
+        self.hass = hass
+        self._client = client
+        self._source = source
+        self._ids = itertools.count(1)
+        # Subscription id -> (event type, event filter, handler)
+        self._subscriptions: dict[
+            int, tuple[str, dict[str, Any] | None, Callable[[dict[str, Any]], None]]
+        ] = {}
+        self._websocket: aiohttp.ClientWebSocketResponse | None = None
+        self._task: asyncio.Task | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        event_type: str,
+        handle_message: Callable[[dict[str, Any]], None],
+        event_filter: dict[str, Any] | None = None,
+    ) -> Callable[[], None]:
+        """Feed events of a type to ``handle_message`` until unsubscribed."""
+        subscription_id = next(self._ids)
+        self._subscriptions[subscription_id] = (event_type, event_filter, handle_message)
+        if self._task is None:
+            # Runs until the last unsubscribe, so it must not hold up startup
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), f"ledfx event stream {self._client.host}"
+            )
+        elif self._websocket is not None:
+            self.hass.async_create_task(
+                self._async_send(self._websocket, self._subscribe_message(subscription_id))
+            )
+
+        @callback
+        def unsubscribe() -> None:
+            if self._subscriptions.pop(subscription_id, None) is None:
+                return
+            if not self._subscriptions:
+                self.async_stop()
+            elif self._websocket is not None:
+                self.hass.async_create_task(
+                    self._async_send(
+                        self._websocket,
+                        {
+                            "id": next(self._ids),
+                            "type": "unsubscribe_event",
+                            "subscription_id": subscription_id,
+                        },
+                    )
+                )
+
+        return unsubscribe
+
+    @callback
+    def async_stop(self) -> None:
+        """Close the websocket and drop all subscriptions."""
+        self._subscriptions.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _subscribe_message(self, subscription_id: int) -> dict[str, Any]:
+        """Return the message that subscribes to an event type on the server."""
+        event_type, event_filter, _ = self._subscriptions[subscription_id]
+        # LEDFX uses the message id as the subscription id
+        message = {"id": subscription_id, "type": "subscribe_event", "event_type": event_type}
+        if event_filter:
+            message["event_filter"] = event_filter
+        return message
+
+    async def _async_send(
+        self, websocket: aiohttp.ClientWebSocketResponse, message: dict[str, Any]
+    ) -> None:
+        """Send a message, a lost connection resubscribes on reconnect."""
+        try:
+            await websocket.send_json(message)
+        except (aiohttp.ClientError, ConnectionResetError) as err:
+            _LOGGER.debug("Could not send %s to LEDFX at %s: %s", message, self._client.host, err)
+
+    async def _async_run(self) -> None:
+        """Consume the stream, reconnecting when it drops."""
+        while True:
+            try:
+                if self._source is not None:
+                    await self._async_consume(self._source())
+                else:
+                    async with self._client.connect_events() as websocket:
+                        self._websocket = websocket
+                        for subscription_id in list(self._subscriptions):
+                            await websocket.send_json(self._subscribe_message(subscription_id))
+                        await self._async_consume(self._client.iter_frames(websocket))
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+                _LOGGER.debug("LEDFX event stream of %s lost: %s", self._client.host, err)
+            except Exception:
+                _LOGGER.exception("Unexpected error in LEDFX event stream of %s", self._client.host)
+            finally:
+                self._websocket = None
+            await asyncio.sleep(WS_RECONNECT_INTERVAL)
+
+    async def _async_consume(self, stream: AsyncIterator[Any]) -> None:
+        """Hand each event to the subscriptions it matches."""
+        async for event in stream:
+            if not isinstance(event, dict):
+                continue
+            event_type = event.get("event_type")
+            for subscribed_type, event_filter, handle_message in list(
+                self._subscriptions.values()
+            ):
+                if subscribed_type != event_type or (
+                    event_filter
+                    and any(event.get(key) != value for key, value in event_filter.items())
+                ):
+                    continue
+                try:
+                    handle_message(event)
+                except Exception:
+                    _LOGGER.exception("Error handling LEDFX event %s", event)
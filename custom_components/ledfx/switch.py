@@ -13,8 +13,12 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .const import DOMAIN
+from .const import DOMAIN, ENTITY_KIND_SWITCH
+from .bootstrap import LEDFXSnapshot
+from .effect_memory import LEDFXEffectMemory
 from .ledfx_client import LEDFXClient
+from .provisioning import LEDFXProvisioner
+from .transition import LEDFXTransitionScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,23 +31,26 @@ async def async_setup_entry(
     """Set up LEDFX switch entities."""
     client: LEDFXClient = hass.data[DOMAIN][config_entry.entry_id]
     coordinator = hass.data[DOMAIN][f"{config_entry.entry_id}_coordinator"]
+    transitions: LEDFXTransitionScheduler = hass.data[DOMAIN][f"{config_entry.entry_id}_transitions"]
+    effect_memory: LEDFXEffectMemory = hass.data[DOMAIN][f"{config_entry.entry_id}_effect_memory"]
+    provisioner: LEDFXProvisioner = hass.data[DOMAIN][f"{config_entry.entry_id}_provisioner"]
 
-    # Fetch devices to get online status
-    try:
-        devices = await client.get_devices()
-    except Exception as err:
-        _LOGGER.error("Failed to get devices: %s", err)
-        devices = {}
-
-    entities = []
-    for virtual_id, virtual_data in coordinator.data.items():
-        # Get device status
-        device_id = virtual_data.get("is_device")
-        device_online = devices.get(device_id, {}).get("online", True) if device_id else True
-        
-        entities.append(LEDFXSwitch(coordinator, client, virtual_id, virtual_data, device_online))
+    # Device status comes from the snapshot taken during setup
+    snapshot: LEDFXSnapshot = hass.data[DOMAIN][f"{config_entry.entry_id}_snapshot"]
+
+    def create_switch(virtual_id: str, virtual_data: dict[str, Any]) -> LEDFXSwitch:
+        return LEDFXSwitch(
+            coordinator,
+            client,
+            transitions,
+            effect_memory,
+            virtual_id,
+            virtual_data,
+            snapshot.device_online(virtual_data),
+        )
 
-    async_add_entities(entities)
+    # Entities are only created for enabled virtuals and kinds
+    provisioner.async_add_platform({ENTITY_KIND_SWITCH: create_switch}, async_add_entities)
 
 
 class LEDFXSwitch(CoordinatorEntity, SwitchEntity):
@@ -55,6 +62,8 @@ class LEDFXSwitch(CoordinatorEntity, SwitchEntity):
         self,
         coordinator: DataUpdateCoordinator,
         client: LEDFXClient,
+        transitions: LEDFXTransitionScheduler,
+        effect_memory: LEDFXEffectMemory,
         virtual_id: str,
         virtual_data: dict[str, Any],
         device_online: bool,
@@ -62,6 +71,8 @@ class LEDFXSwitch(CoordinatorEntity, SwitchEntity):
         """Initialize the switch."""
         super().__init__(coordinator)
         self._client = client
+        self._transitions = transitions
+        self._effect_memory = effect_memory
         self._virtual_id = virtual_id
         self._attr_unique_id = f"ledfx_{virtual_id}"
         self._attr_name = None  # Use device name
@@ -96,6 +107,10 @@ class LEDFXSwitch(CoordinatorEntity, SwitchEntity):
             effect_config = {}
             if self.virtual_data.get("effect", {}).get("config"):
                 effect_config = self.virtual_data["effect"]["config"].copy()
+
+            # Override a running fade and undo the dimming of a fade-out
+            self._transitions.async_cancel(self._virtual_id)
+            self._effect_memory.async_restore_brightness(self._virtual_id, effect_config)
             
             # Set effect (this activates the virtual)
             await self._client.set_virtual_effect(self._virtual_id, last_effect, effect_config)
@@ -109,6 +124,9 @@ class LEDFXSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the virtual off."""
         try:
+            # A running fade would turn the virtual back on
+            self._transitions.async_cancel(self._virtual_id)
+
             # Clear effect (deactivates virtual)
             await self._client.clear_virtual_effect(self._virtual_id)
             
@@ -0,0 +1,239 @@
+"""Client-side brightness and color transitions for LEDFX virtuals."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .ledfx_client import LEDFXClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def solid_gradient(rgb: tuple[int, int, int]) -> str:
+    """Return a LEDFX gradient string for a single solid color."""
+    r, g, b = rgb
+    return f"linear-gradient(90deg, rgb({r}, {g}, {b}) 0%, rgb({r}, {g}, {b}) 100%)"
+
+
+class Fade:
+    """A running transition of one virtual."""
+
+    def __init__(
+        self,
+        effect_type: str,
+        config: dict[str, Any],
+        start_brightness: float,
+        target_brightness: float,
+        start_rgb: tuple[int, int, int] | None,
+        target_rgb: tuple[int, int, int] | None,
+        duration: float,
+        on_done: Callable[[], None] | None,
+        send_final: bool = True,
+    ) -> None:
+        """Initialize the fade."""
+        self.effect_type = effect_type
+        self.config = config
+        self.start_brightness = start_brightness
+        self.target_brightness = target_brightness
+        self.start_rgb = start_rgb
+        self.target_rgb = target_rgb
+        self.started = time.monotonic()
+        self.duration = duration
+        self.on_done = on_done
+        self.send_final = send_final
+
+    def progress(self, now: float) -> float:
+        """Return how far the fade has come, from 0.0 to 1.0."""
+        return min((now - self.started) / self.duration, 1.0)
+
+    def state_at(
+        self, progress: float
+    ) -> tuple[float, tuple[int, int, int] | None]:
+        """Return the interpolated brightness and color."""
+        brightness = self.start_brightness + (self.target_brightness - self.start_brightness) * progress
+        rgb = self.target_rgb
+        if self.start_rgb is not None and self.target_rgb is not None:
+            rgb = tuple(
+                round(start + (target - start) * progress)
+                for start, target in zip(self.start_rgb, self.target_rgb)
+            )
+        return brightness, rgb
+
+    def config_at(self, progress: float) -> dict[str, Any]:
+        """Return the effect config to send for a step."""
+        brightness, rgb = self.state_at(progress)
+        config = {**self.config, "brightness": round(brightness, 4)}
+        if rgb is not None:
+            config["gradient"] = solid_gradient(rgb)
+            config["color"] = list(rgb)
+        return config
+
+
+class LEDFXTransitionScheduler:
+    """Drive all fades of one LEDFX server from a single fixed-rate timer.
+
+    Every tick sends at most one merged update per virtual. When the previous
+    update of a virtual has not completed yet, the step is dropped instead of
+    queued, so slow servers see fewer steps rather than a growing backlog. The
+    final step of a fade is never dropped.
+
+    A fade's ``on_done`` only runs if the fade is still the latest one of its
+    virtual, so a fade that was cancelled or replaced while its final step
+    was in flight does not act on the new state.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: LEDFXClient, rate: int) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.client = client
+        self.interval = 1 / rate
+        self.dropped_steps = 0
+        self._fades: dict[str, Fade] = {}
+        self._in_flight: set[str] = set()
+        # Fades that have ended and wait for their on_done
+        self._finishing: dict[str, Fade] = {}
+        self._unsub_tick: Callable[[], None] | None = None
+
+    def current_state(
+        self, virtual_id: str
+    ) -> tuple[float, tuple[int, int, int] | None] | None:
+        """Return the brightness and color a running fade is at, if any."""
+        fade = self._fades.get(virtual_id)
+        if fade is None:
+            return None
+        return fade.state_at(fade.progress(time.monotonic()))
+
+    def target_state(
+        self, virtual_id: str
+    ) -> tuple[float, tuple[int, int, int] | None] | None:
+        """Return the brightness and color a running fade is heading to, if any."""
+        fade = self._fades.get(virtual_id)
+        if fade is None:
+            return None
+        return fade.target_brightness, fade.target_rgb
+
+    def is_fading(self, virtual_id: str) -> bool:
+        """Return if a fade of the virtual is running or finishing."""
+        return virtual_id in self._fades or virtual_id in self._finishing
+
+    @callback
+    def async_start(
+        self,
+        virtual_id: str,
+        effect_type: str,
+        config: dict[str, Any],
+        start_brightness: float,
+        target_brightness: float,
+        start_rgb: tuple[int, int, int] | None,
+        target_rgb: tuple[int, int, int] | None,
+        duration: float,
+        on_done: Callable[[], None] | None = None,
+        send_final: bool = True,
+    ) -> None:
+        """Start a fade, replacing any fade already running on the virtual.
+
+        With ``send_final`` off the target is never sent, for fades that
+        ``on_done`` completes in another way, such as clearing the effect.
+        """
+        self._finishing.pop(virtual_id, None)
+        self._fades[virtual_id] = Fade(
+            effect_type,
+            config,
+            start_brightness,
+            target_brightness,
+            start_rgb,
+            target_rgb,
+            duration,
+            on_done,
+            send_final,
+        )
+        if self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=self.interval)
+            )
+
+    @callback
+    def async_cancel(self, virtual_id: str) -> None:
+        """Stop a running fade where it is."""
+        self._fades.pop(virtual_id, None)
+        self._finishing.pop(virtual_id, None)
+        self._async_stop_if_idle()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop all fades."""
+        self._fades.clear()
+        self._finishing.clear()
+        self._async_stop_if_idle()
+
+    @callback
+    def _async_stop_if_idle(self) -> None:
+        """Cancel the timer when nothing is fading."""
+        if not self._fades and self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+    @callback
+    def _async_tick(self, _now: Any) -> None:
+        """Send the current step of every running fade."""
+        now = time.monotonic()
+        batch: list[tuple[str, str, dict[str, Any], Fade | None]] = []
+        done: list[str] = []
+
+        for virtual_id, fade in list(self._fades.items()):
+            progress = fade.progress(now)
+            finished = progress >= 1.0
+            if virtual_id in self._in_flight:
+                # Keep the fade around so its final step goes out next tick
+                if not finished:
+                    self.dropped_steps += 1
+                continue
+            if finished:
+                del self._fades[virtual_id]
+                self._finishing[virtual_id] = fade
+                if not fade.send_final:
+                    done.append(virtual_id)
+                    continue
+            batch.append(
+                (virtual_id, fade.effect_type, fade.config_at(progress), fade if finished else None)
+            )
+
+        self._async_stop_if_idle()
+        for virtual_id in done:
+            self._async_finish(virtual_id, self._finishing[virtual_id])
+        if batch:
+            self._in_flight.update(virtual_id for virtual_id, *_ in batch)
+            self.hass.async_create_task(self._async_send(batch))
+
+    async def _async_send(
+        self, batch: list[tuple[str, str, dict[str, Any], Fade | None]]
+    ) -> None:
+        """Send one tick worth of updates concurrently."""
+        try:
+            await asyncio.gather(
+                *(
+                    self.client.update_virtual_effect(virtual_id, effect_type, config)
+                    for virtual_id, effect_type, config, _ in batch
+                )
+            )
+        finally:
+            for virtual_id, _, _, finished_fade in batch:
+                self._in_flight.discard(virtual_id)
+                if finished_fade is not None:
+                    self._async_finish(virtual_id, finished_fade)
+
+    @callback
+    def _async_finish(self, virtual_id: str, fade: Fade) -> None:
+        """Run the on_done of a fade unless it was cancelled or replaced."""
+        if self._finishing.get(virtual_id) is not fade:
+            return
+        del self._finishing[virtual_id]
+        if fade.on_done is not None:
+            fade.on_done()
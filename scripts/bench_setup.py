@@ -0,0 +1,127 @@
+"""Measure LEDFX setup time against a slow fake LEDFX server.
+
+Compares the sequential requests the integration made during setup before
+the bootstrap snapshot with the concurrent snapshot fetch. A stale preset
+catalog is fetched in the background after setup, its time is printed
+separately. Run from the repository root with Home Assistant installed:
+
+    python scripts/bench_setup.py --delay 0.2 --virtuals 10 --effects 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_components.ledfx.bootstrap import async_fetch_snapshot  # noqa: E402
+from custom_components.ledfx.ledfx_client import LEDFXClient  # noqa: E402
+from custom_components.ledfx.const import PRESET_FETCH_CONCURRENCY  # noqa: E402
+
+
+def fake_ledfx(delay: float, virtuals: int, effects: int) -> web.Application:
+    """Return a LEDFX API that answers every request after ``delay`` seconds."""
+    responses = {
+        "/api/info": {"version": "2.0.0"},
+        "/api/virtuals": {
+            "virtuals": {
+                f"virtual{index}": {"config": {"name": f"Virtual {index}"}}
+                for index in range(virtuals)
+            }
+        },
+        "/api/devices": {"devices": {}},
+        "/api/schema": {
+            "effects": {f"effect{index}": {"category": "Classic"} for index in range(effects)}
+        },
+        "/api/playlists": {"playlists": {}},
+    }
+    for index in range(effects):
+        responses[f"/api/effects/effect{index}/presets"] = {
+            "ledfx_presets": {"reset": {"name": "Reset", "config": {}}},
+            "user_presets": {},
+        }
+
+    async def handler(request: web.Request) -> web.Response:
+        await asyncio.sleep(delay)
+        return web.json_response(responses[request.path])
+
+    app = web.Application()
+    for path in responses:
+        app.router.add_get(path, handler)
+    return app
+
+
+async def sequential_setup(client: LEDFXClient, virtuals: int) -> None:
+    """Replay the requests of the setup before the bootstrap snapshot."""
+    # __init__: connection test and first refresh
+    await client.get_info()
+    await client.get_virtuals()
+    # switch.py and select.py: one device lookup each
+    await client.get_devices()
+    await client.get_devices()
+    # Every effect select fetched the schema when it was added
+    await asyncio.gather(*(client.get_effects() for _ in range(2 * virtuals)))
+
+
+async def fetch_presets(client: LEDFXClient, effects: int) -> None:
+    """Replay the preset fetch of a first start or after a LEDFX update."""
+    semaphore = asyncio.Semaphore(PRESET_FETCH_CONCURRENCY)
+
+    async def fetch(effect_id: str) -> None:
+        async with semaphore:
+            await client.get_effect_presets(effect_id)
+
+    await asyncio.gather(*(fetch(f"effect{index}") for index in range(effects)))
+
+
+async def measure(delay: float, virtuals: int, effects: int, runs: int) -> None:
+    """Print the mean setup time of both variants and the preset fetch."""
+    runner = web.AppRunner(fake_ledfx(delay, virtuals, effects))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    # Same pool limits as the integration's shared session
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=4)
+    try:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            client = LEDFXClient("127.0.0.1", port, session)
+            for name, setup in (
+                ("sequential", lambda: sequential_setup(client, virtuals)),
+                ("snapshot", lambda: async_fetch_snapshot(client)),
+                ("presets", lambda: fetch_presets(client, effects)),
+            ):
+                start = time.perf_counter()
+                for _ in range(runs):
+                    await setup()
+                elapsed = (time.perf_counter() - start) / runs
+                print(f"{name:>10}: {elapsed:.2f} s")
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delay", type=float, default=0.2, help="seconds per request")
+    parser.add_argument("--virtuals", type=int, default=10)
+    parser.add_argument("--effects", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{args.virtuals} virtuals, {args.effects} effects, "
+        f"{args.delay * 1000:.0f} ms per request"
+    )
+    asyncio.run(measure(args.delay, args.virtuals, args.effects, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Helpers shared by the LEDFX tests."""
+import asyncio
+
+import pytest
+
+
+class FakeStream:
+    """Hand out one list of events per connection, raising exceptions in it."""
+
+    def __init__(self, connections: list[list]) -> None:
+        self.connections = connections
+        self.opened = 0
+
+    async def __call__(self):
+        if self.opened == len(self.connections):
+            # Out of connections, stay open like an idle stream
+            await asyncio.Future()
+        events = self.connections[self.opened]
+        self.opened += 1
+        for event in events:
+            if isinstance(event, BaseException):
+                raise event
+            yield event
+
+    async def drained(self) -> None:
+        """Wait until every connection has been used."""
+        while self.opened < len(self.connections):
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    async def run(self, coroutine) -> None:
+        """Run a consumer until every connection has been used."""
+        task = asyncio.create_task(coroutine)
+        await self.drained()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
@@ -0,0 +1,10 @@
+"""Fixtures for the LEDFX tests."""
+import pytest
+
+from custom_components.ledfx import stream
+
+
+@pytest.fixture(autouse=True)
+def no_reconnect_delay(monkeypatch):
+    """Reconnect right away."""
+    monkeypatch.setattr(stream, "WS_RECONNECT_INTERVAL", 0)
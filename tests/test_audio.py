@@ -0,0 +1,63 @@
+"""Tests for the LEDFX audio telemetry."""
+import asyncio
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ledfx.audio import AudioWindow, LEDFXAudioMonitor
+from custom_components.ledfx.ledfx_client import LEDFXClient
+from custom_components.ledfx.stream import LEDFXEventStream
+
+from .common import FakeStream
+
+
+def test_window_summary():
+    """Levels and beats are reduced to one summary per window."""
+    window = AudioWindow()
+    for level in (0.2, 0.4, 0.9):
+        window.add_level(level)
+    window.add_beat(120.0)
+    window.add_beat()
+
+    assert window.flush() == {
+        "mean_level": 0.5,
+        "peak_level": 0.9,
+        "bpm": 120.0,
+        "beats": 2,
+    }
+    summary = window.flush()
+    assert summary["mean_level"] is None
+    assert summary["beats"] == 0
+    assert summary["bpm"] == 120.0
+
+
+def test_fake_stream_survives_bad_events(tmp_path):
+    """Malformed events are skipped and a failing stream is reopened."""
+    source = FakeStream(
+        [
+            [
+                {"event_type": "audio_level", "level": 0.5},
+                ["not", "a", "dict"],
+                {"event_type": "audio_level", "level": "loud"},
+                {"event_type": "beat", "bpm": 128},
+                ValueError("bad frame"),
+            ],
+            [{"event_type": "audio_level", "level": 1.0}],
+        ]
+    )
+
+    async def main():
+        hass = HomeAssistant(str(tmp_path))
+        stream = LEDFXEventStream(hass, LEDFXClient("localhost", 8888, None), source)
+        monitor = LEDFXAudioMonitor(hass, stream, 5)
+        monitor.async_start()
+        await source.drained()
+        monitor.async_stop()
+        return monitor._aggregate.flush()
+
+    assert asyncio.run(main()) == {
+        "mean_level": 0.75,
+        "peak_level": 1.0,
+        "bpm": 128.0,
+        "beats": 1,
+    }
+    assert source.opened == 2
@@ -0,0 +1,45 @@
+"""Tests for the LEDFX effect memory."""
+import asyncio
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ledfx.effect_memory import LEDFXEffectMemory
+
+
+def test_fading_virtuals_are_not_remembered(tmp_path):
+    """Configs seen while a virtual fades are not stored, on any path."""
+    fading = {"strip"}
+
+    async def main():
+        memory = LEDFXEffectMemory(HomeAssistant(str(tmp_path)), "entry", fading.__contains__)
+        memory.async_remember("strip", "gradient", {"brightness": 0.02})
+        memory.async_remember("other", "gradient", {"brightness": 0.8})
+        fading.clear()
+        memory.async_remember("strip", "rainbow", {"brightness": 1.0})
+        return memory
+
+    memory = asyncio.run(main())
+    assert memory.get("strip", "gradient") is None
+    assert memory.get("strip", "rainbow") == {"brightness": 1.0}
+    assert memory.get("other", "gradient") == {"brightness": 0.8}
+
+
+def test_faded_out_brightness_survives_reload(tmp_path):
+    """The brightness from before a fade-out is restored once, also after a reload."""
+
+    async def main():
+        hass = HomeAssistant(str(tmp_path))
+        memory = LEDFXEffectMemory(hass, "entry", lambda virtual_id: False)
+        memory.async_remember_brightness("strip", 0.6)
+        await memory.async_save()
+
+        reloaded = LEDFXEffectMemory(hass, "entry", lambda virtual_id: False)
+        await reloaded.async_load()
+        config = {"gradient": "red"}
+        restored = reloaded.async_restore_brightness("strip", config)
+        return config, restored, reloaded.async_restore_brightness("strip", {})
+
+    config, restored, restored_again = asyncio.run(main())
+    assert config == {"gradient": "red", "brightness": 0.6}
+    assert restored is True
+    assert restored_again is False
@@ -0,0 +1,42 @@
+"""Tests for the LEDFX playlists."""
+import asyncio
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ledfx.ledfx_client import LEDFXClient
+from custom_components.ledfx.playlists import LEDFXPlaylists
+from custom_components.ledfx.stream import LEDFXEventStream
+
+from .common import FakeStream
+
+
+def test_playlist_events_set_running_playlist(tmp_path):
+    """Starts and stops made on the server are picked up."""
+    source = FakeStream(
+        [
+            [
+                {"event_type": "playlist_started", "playlist_id": "evening"},
+                {"event_type": "playlist_stopped"},
+                {"event_type": "playlist_started", "playlist_id": "morning"},
+            ]
+        ]
+    )
+    updates = []
+
+    async def main():
+        hass = HomeAssistant(str(tmp_path))
+        client = LEDFXClient("localhost", 8888, None)
+        stream = LEDFXEventStream(hass, client, source)
+        playlists = LEDFXPlaylists(
+            hass, client, {"evening": {"name": "Evening"}, "morning": {"name": "Morning"}}
+        )
+        assert playlists.running is None
+        playlists.async_add_listener(lambda: updates.append(playlists.active_name))
+        unsubscribe = playlists.async_track(stream)
+        await source.drained()
+        unsubscribe()
+        return playlists
+
+    playlists = asyncio.run(main())
+    assert updates == ["Evening", None, "Morning"]
+    assert playlists.running is True
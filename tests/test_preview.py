@@ -0,0 +1,70 @@
+"""Tests for the LEDFX pixel preview."""
+import asyncio
+import struct
+import zlib
+
+import aiohttp
+import numpy as np
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ledfx.ledfx_client import LEDFXClient
+from custom_components.ledfx.preview import LEDFXPixelPreview, downsample, render_preview
+from custom_components.ledfx.stream import LEDFXEventStream
+
+from .common import FakeStream
+
+
+def test_downsample_channel_major():
+    """LEDFX's channel-major frames are averaged into bins."""
+    frame = [[0, 100, 200, 255], [0, 0, 0, 0], [10, 10, 10, 10]]
+    assert downsample(frame, 2).tolist() == [[50, 0, 10], [227, 0, 10]]
+
+
+def test_render_preview_png():
+    """A long strip renders to a small, valid PNG."""
+    pixels = np.random.default_rng(0).integers(0, 256, (1000, 3)).tolist()
+    png = render_preview(pixels, 128, 16)
+
+    assert png.startswith(b"\x89PNG\r\n\x1a\n")
+    width, height = struct.unpack(">II", png[16:24])
+    assert (width, height) == (128, 16)
+    length = struct.unpack(">I", png[33:37])[0]
+    raw = zlib.decompress(png[41 : 41 + length])
+    assert len(raw) == 16 * (1 + 128 * 3)
+
+
+def test_previews_share_one_stream(tmp_path):
+    """Previews of several virtuals share one connection and keep their own frames."""
+    source = FakeStream(
+        [
+            [
+                {"event_type": "visualisation_update", "vis_id": "strip", "pixels": [[1], [2], [3]]},
+                "garbage",
+                {"event_type": "visualisation_update", "vis_id": "other", "pixels": [[9], [9], [9]]},
+                aiohttp.ClientConnectionError(),
+            ],
+            [{"event_type": "visualisation_update", "vis_id": "strip", "pixels": [[4], [5], [6]]}],
+        ]
+    )
+
+    async def main():
+        hass = HomeAssistant(str(tmp_path))
+        stream = LEDFXEventStream(hass, LEDFXClient("localhost", 8888, None), source)
+        strip = LEDFXPixelPreview(hass, stream, "strip")
+        other = LEDFXPixelPreview(hass, stream, "other")
+        strip.async_touch()
+        other.async_touch()
+        await source.drained()
+
+        assert strip.pixels == [[4], [5], [6]]
+        assert other.pixels == [[9], [9], [9]]
+
+        strip.async_stop()
+        assert other.subscribed
+        other.async_stop()
+        assert stream._task is None
+
+    asyncio.run(main())
+    # One connection for both previews, opened again once after it failed
+    assert source.opened == 2
@@ -0,0 +1,17 @@
+"""Tests for the LEDFX entity provisioning."""
+from custom_components.ledfx.provisioning import entity_kind_of
+
+
+def test_entity_kind_of_unique_ids():
+    """Per-virtual unique ids map back to their kind, server entities do not."""
+    assert entity_kind_of("switch", "ledfx_strip_1") == ("switch", "strip_1")
+    assert entity_kind_of("light", "ledfx_strip_1") == ("light", "strip_1")
+    assert entity_kind_of("select", "ledfx_strip_1_effect_reactive") == (
+        "effect_reactive",
+        "strip_1",
+    )
+    assert entity_kind_of("select", "ledfx_strip_1_preset") == ("preset", "strip_1")
+    assert entity_kind_of("camera", "ledfx_strip_1_preview") == ("preview", "strip_1")
+    assert entity_kind_of("select", "ledfx_entry_playlist") is None
+    assert entity_kind_of("sensor", "ledfx_entry_audio_level") is None
+    assert entity_kind_of("switch", "other_strip_1") is None
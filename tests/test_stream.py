@@ -0,0 +1,108 @@
+"""Tests for the shared LEDFX event stream."""
+import asyncio
+from contextlib import AsyncExitStack
+
+from aiohttp import web
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ledfx.const import POOL_LIMIT_PER_HOST
+from custom_components.ledfx.hub import LEDFXHub
+from custom_components.ledfx.ledfx_client import LEDFXClient
+from custom_components.ledfx.stream import LEDFXEventStream
+
+
+async def start_server(websocket_handler):
+    """Serve a websocket handler and /api/info on a free port."""
+
+    async def info_handler(request):
+        return web.json_response({"version": "2.0.0"})
+
+    app = web.Application()
+    app.router.add_get("/api/websocket", websocket_handler)
+    app.router.add_get("/api/info", info_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, runner.addresses[0][1]
+
+
+def test_websockets_leave_request_pool_free():
+    """Open websockets do not take the pooled connections requests need."""
+
+    async def websocket_handler(request):
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        async for _message in websocket:
+            pass
+        return websocket
+
+    async def main():
+        runner, port = await start_server(websocket_handler)
+        hub = LEDFXHub(None)
+        client = LEDFXClient("127.0.0.1", port, hub.session, None, hub.stream_session)
+        try:
+            async with AsyncExitStack() as stack:
+                for _ in range(POOL_LIMIT_PER_HOST + 1):
+                    await stack.enter_async_context(client.connect_events())
+                return await asyncio.wait_for(client.get_info(), 2)
+        finally:
+            await hub.async_close()
+            await runner.cleanup()
+
+    assert asyncio.run(main()) == {"version": "2.0.0"}
+
+
+def test_subscriptions_share_the_socket(tmp_path):
+    """Subscriptions share the open socket, malformed frames are skipped."""
+    received = []
+    messages = []
+    subscribed = asyncio.Queue()
+
+    async def websocket_handler(request):
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        async for message in websocket:
+            message = message.json()
+            messages.append(message)
+            if message["type"] == "subscribe_event":
+                await websocket.send_str("not json")
+                await websocket.send_str("[1, 2, 3]")
+                await websocket.send_json(
+                    {"event_type": message["event_type"], "vis_id": "strip", "seen": len(messages)}
+                )
+            subscribed.put_nowait(message)
+        return websocket
+
+    async def main():
+        runner, port = await start_server(websocket_handler)
+        hub = LEDFXHub(None)
+        client = LEDFXClient("127.0.0.1", port, hub.session, None, hub.stream_session)
+        stream = LEDFXEventStream(HomeAssistant(str(tmp_path)), client)
+        try:
+            unsub_beat = stream.async_subscribe("beat", received.append)
+            await asyncio.wait_for(subscribed.get(), 2)
+            stream.async_subscribe(
+                "visualisation_update", received.append, {"vis_id": "strip"}
+            )
+            await asyncio.wait_for(subscribed.get(), 2)
+            unsub_beat()
+            await asyncio.wait_for(subscribed.get(), 2)
+        finally:
+            stream.async_stop()
+            await hub.async_close()
+            await runner.cleanup()
+
+    asyncio.run(main())
+    assert [message["type"] for message in messages] == [
+        "subscribe_event",
+        "subscribe_event",
+        "unsubscribe_event",
+    ]
+    assert messages[2]["subscription_id"] == messages[0]["id"]
+    assert messages[1]["event_filter"] == {"vis_id": "strip"}
+    assert received == [
+        {"event_type": "beat", "vis_id": "strip", "seen": 1},
+        {"event_type": "visualisation_update", "vis_id": "strip", "seen": 2},
+    ]